@@ -3,63 +3,76 @@
 Anforderungen."""
 
 import argparse
-import ast
-import json
+import functools
+import importlib.util
 import math
-import operator
 import random
+import re
+import shutil
 import sys
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
 from fractions import Fraction
-from typing import Sequence
+from types import MappingProxyType
+from typing import Callable, Final, Sequence
 
-# Für Word-Export
+# Für Word-Export (nur Suche nach dem Paket; python-docx wird erst in
+# save_word importiert)
+HAS_DOCX = importlib.util.find_spec("docx") is not None
+
+# Optional schnellerer JSON-Export
 try:
-    from docx import Document
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.shared import Pt
+    import orjson
 
-    HAS_DOCX = True
+    HAS_ORJSON = True
 except ImportError:
-    HAS_DOCX = False
-    # Dummy-Klassen für den Fall, dass python-docx nicht installiert ist
-    Document = None
-    Pt = None
+    HAS_ORJSON = False
 
-# Für LaTeX-Export
-try:
-    import subprocess
+# Für LaTeX-Export (nur PATH-Suche, kein Prozessstart beim Import)
+HAS_LATEX = shutil.which("pdflatex") is not None
 
-    HAS_LATEX = (
-        subprocess.run(["pdflatex", "--version"], capture_output=True).returncode == 0
-    )
-except Exception:
-    HAS_LATEX = False
+
+# Quantisierungsschritte für die üblichen Nachkommastellen (0 bis 6)
+_QUANTUMS = tuple(Decimal(1).scaleb(-nd) for nd in range(7))
+_THOUSANDS_TRANS = str.maketrans(",.", ".,")
 
 
 def _quantize(x: float | Decimal, nd: int) -> Decimal:
     """Quantize helper with ROUND_HALF_UP."""
     q = Decimal(str(x))
-    fmt_str = "1" if nd == 0 else "1." + "0" * nd
-    return q.quantize(Decimal(fmt_str), rounding=ROUND_HALF_UP)
+    quantum = _QUANTUMS[nd] if 0 <= nd < len(_QUANTUMS) else Decimal(1).scaleb(-nd)
+    return q.quantize(quantum, rounding=ROUND_HALF_UP)
 
 
 def de_format(x: float | Decimal, nd: int = 2, thousand: bool = False) -> str:
     """Format number with comma as decimal separator."""
+    if type(x) is int and nd >= 0:
+        # Ganzzahlen brauchen weder Decimal noch Rundung
+        ganz = f"{x:,}".replace(",", ".") if thousand else str(x)
+        return f"{ganz},{'0' * nd}" if nd else ganz
     d = _quantize(x, nd)
-    s = f"{d:,.{nd}f}" if thousand else f"{d:.{nd}f}"
-    return s.replace(",", "X").replace(".", ",").replace("X", ".")
+    if not thousand:
+        return f"{d:.{nd}f}".replace(".", ",")
+    return f"{d:,.{nd}f}".translate(_THOUSANDS_TRANS)
 
 
 def fmt_int_or_dec(x: float | Decimal, nd_if_dec: int = 2) -> str:
     d = Decimal(str(x))
-    if d == d.to_integral_value(rounding=ROUND_HALF_UP):
-        return str(int(d.quantize(Decimal("1"), rounding=ROUND_HALF_UP)))
+    i = d.to_integral_value(rounding=ROUND_HALF_UP)
+    if d == i:
+        return str(int(i))
     return de_format(d, nd_if_dec)
 
 
+def fmt_trim(x: float | Decimal, nd: int = 4) -> str:
+    """Rundet auf ``nd`` Stellen und lässt nachgestellte Nullen weg."""
+    return f"{_quantize(x, nd).normalize():f}".replace(".", ",")
+
+
 fmt = de_format
 
 
@@ -71,6 +84,14 @@ class Schwierigkeit(Enum):
     SCHWER = 3
 
 
+# CLI-Werte von --stufe
+_STUFE_MAP: Final = {
+    "einfach": Schwierigkeit.EINFACH,
+    "mittel": Schwierigkeit.MITTEL,
+    "schwer": Schwierigkeit.SCHWER,
+}
+
+
 @dataclass
 class AustrianData:
     """Realistische österreichische Daten für Textaufgaben."""
@@ -85,6 +106,9 @@ class AustrianData:
         "cnc_fraesen": {"gehalt_min": 2300, "gehalt_max": 2800, "stunden": (38, 42)},
     }
 
+    # Anzeigenamen der Berufe, z.B. "kfz_techniker" -> "Kfz-Techniker"
+    beruf_labels = {k: k.replace("_", "-").title() for k in berufe}
+
     preise = {
         "stahl_kg": 0.85,
         "aluminium_kg": 2.20,
@@ -119,44 +143,174 @@ class AustrianData:
     }
 
 
-class MathSolver:
-    """Robuster mathematischer Solver mit Bruchrechnung."""
+# Opcodes der Stack-Maschine für MathSolver.evaluate_expression
+OP_PUSH, OP_ADD, OP_SUB, OP_MUL, OP_DIV, OP_NEG = range(6)
+
+_TOKEN_RE = re.compile(r"\s*(?:((?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)|(.))")
+_BINARY_OPS = {"+": OP_ADD, "-": OP_SUB, "*": OP_MUL, "/": OP_DIV}
+_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2, "u-": 3}
+_SYMBOLS = frozenset("+-*/()")
+
 
-    _ops = {
-        ast.Add: operator.add,
-        ast.Sub: operator.sub,
-        ast.Mult: operator.mul,
-        ast.Div: operator.truediv,
+def _tokenize(expr: str):
+    """Zerlegt einen normalisierten Ausdruck in Zahlen und Operatoren."""
+    for m in _TOKEN_RE.finditer(expr.rstrip()):
+        number, symbol = m.groups()
+        if number is not None:
+            is_int = number.isdigit()
+            yield OP_PUSH, int(number) if is_int else float(number)
+        elif symbol in _SYMBOLS:
+            yield None, symbol
+        else:
+            raise ValueError("Ungültiger Ausdruck")
+
+
+def _compile_expression(expr: str) -> tuple[tuple[int, int | float | None], ...]:
+    """Übersetzt einen Ausdruck per Shunting-Yard in Opcodes (UPN)."""
+    code: list[tuple[int, int | float | None]] = []
+    stack: list[str] = []
+    expect_operand = True
+
+    def _emit(sym: str):
+        code.append((OP_NEG, None) if sym == "u-" else (_BINARY_OPS[sym], None))
+
+    for kind, value in _tokenize(expr):
+        if kind == OP_PUSH:
+            if not expect_operand:
+                raise ValueError("Ungültiger Ausdruck")
+            code.append((OP_PUSH, value))
+            expect_operand = False
+        elif value == "(":
+            if not expect_operand:
+                raise ValueError("Ungültiger Ausdruck")
+            stack.append(value)
+        elif value == ")":
+            if expect_operand:
+                raise ValueError("Ungültiger Ausdruck")
+            while stack and stack[-1] != "(":
+                _emit(stack.pop())
+            if not stack:
+                raise ValueError("Klammern nicht ausgeglichen")
+            stack.pop()
+        elif expect_operand:
+            # Nur das Minus ist als Vorzeichen erlaubt (rechtsassoziativ)
+            if value != "-":
+                raise ValueError("Ungültiger Ausdruck")
+            stack.append("u-")
+        else:
+            prec = _PRECEDENCE[value]
+            while stack and stack[-1] != "(" and _PRECEDENCE[stack[-1]] >= prec:
+                _emit(stack.pop())
+            stack.append(value)
+            expect_operand = True
+
+    if expect_operand:
+        raise ValueError("Ungültiger Ausdruck")
+    while stack:
+        sym = stack.pop()
+        if sym == "(":
+            raise ValueError("Klammern nicht ausgeglichen")
+        _emit(sym)
+    return tuple(code)
+
+
+def _run(code: Sequence[tuple[int, int | float | None]]) -> int | float:
+    """Führt kompilierte Opcodes auf einem Listen-Stack aus."""
+    s: list[int | float] = []
+    for op, a in code:
+        if op == OP_PUSH:
+            s.append(a)
+        elif op == OP_NEG:
+            s[-1] = -s[-1]
+        else:
+            b = s.pop()
+            if op == OP_ADD:
+                s[-1] += b
+            elif op == OP_SUB:
+                s[-1] -= b
+            elif op == OP_MUL:
+                s[-1] *= b
+            else:
+                s[-1] /= b
+    return s[0]
+
+
+_EXPR_TRANS = str.maketrans(
+    {
+        "·": "*",
+        "×": "*",
+        ":": "/",
+        "÷": "/",
+        "−": "-",
+        ",": ".",
+        "[": "(",
+        "]": ")",
     }
+)
+
+
+def _normalize(expr: str) -> str:
+    """Ersetzt typografische Rechenzeichen durch ASCII-Operatoren."""
+    return expr.translate(_EXPR_TRANS)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_and_eval(expr: str) -> float | None:
+    """Wertet einen normalisierten Ausdruck aus; None bei ungültiger Eingabe."""
+    try:
+        return round(float(_run(_compile_expression(expr))), 4)
+    except (ValueError, ZeroDivisionError, IndexError, OverflowError):
+        return None
+
+
+# Stelle -> (Quantisierungsschritt, Faktor); Faktor nur für Stellen vor dem Komma
+_PLACES: dict[str, tuple[Decimal | None, Decimal | None]] = {
+    "t": (Decimal("0.001"), None),  # Tausendstel
+    "h": (Decimal("0.01"), None),  # Hundertstel
+    "z": (Decimal("0.1"), None),  # Zehntel
+    "E": (Decimal("1"), None),  # Einer
+    "Z": (None, Decimal("10")),  # Zehner
+    "H": (None, Decimal("100")),  # Hunderter
+    "T": (None, Decimal("1000")),  # Tausender
+    "ZT": (None, Decimal("10000")),  # Zehntausender
+    "HT": (None, Decimal("100000")),  # Hunderttausender
+    "M": (None, Decimal("1000000")),  # Million
+}
+
+
+# kgV-Tabelle für alle Nennerpaare der Bruchaufgaben (Nenner <= 30)
+_MAX_NENNER = 30
+_LCM = [
+    [a * b // math.gcd(a, b) if a and b else 0 for b in range(_MAX_NENNER + 1)]
+    for a in range(_MAX_NENNER + 1)
+]
+
+# Zulässige Nennerpaare je Höchstnenner: keiner teilt den anderen (also auch
+# verschieden) und der gemeinsame Nenner bleibt unter 100
+_BRUCH_NENNERPAARE = {
+    max_d: tuple(
+        (d1, d2)
+        for d1 in range(2, max_d + 1)
+        for d2 in range(2, max_d + 1)
+        if d1 % d2 and d2 % d1 and _LCM[d1][d2] < 100
+    )
+    for max_d in (12, 20, 30)
+}
+
+
+# Dezimalzahlen der schweren Gleichung und ihre exakten Bruchwerte
+_GLEICHUNG_DEZIMALEN = (1.5, 2.5, 0.5)
+_DEC_TO_FRAC = {dec: Fraction(str(dec)) for dec in _GLEICHUNG_DEZIMALEN}
+
+
+class MathSolver:
+    """Robuster mathematischer Solver mit Bruchrechnung."""
 
     @staticmethod
     def evaluate_expression(expr: str) -> float | None:
         """Sichere Auswertung mathematischer Ausdrücke."""
-
-        def _eval(node):
-            if isinstance(node, (ast.Num, ast.Constant)):
-                v = getattr(node, "n", getattr(node, "value", None))
-                if not isinstance(v, (int, float)):
-                    raise ValueError("Ungültiger Wert")
-                return v
-            if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
-                return -_eval(node.operand)
-            if isinstance(node, ast.BinOp) and type(node.op) in MathSolver._ops:
-                return MathSolver._ops[type(node.op)](
-                    _eval(node.left), _eval(node.right)
-                )
-            raise ValueError("Ungültiger Ausdruck")
-
         try:
-            expr = (
-                expr.replace("·", "*")
-                .replace("×", "*")
-                .replace(":", "/")
-                .replace("÷", "/")
-                .replace(",", ".")
-            )
-            tree = ast.parse(expr, mode="eval")
-            return round(float(_eval(tree.body)), 4)
+            return _parse_and_eval(_normalize(expr))
         except Exception:
             return None
 
@@ -184,28 +338,14 @@ class MathSolver:
     @staticmethod
     def round_to_place(value: float, place: str) -> float:
         """Rundet auf die angegebene Stelle."""
-        places_map = {
-            "t": 3,  # Tausendstel
-            "h": 2,  # Hundertstel
-            "z": 1,  # Zehntel
-            "E": 0,  # Einer
-            "Z": -1,  # Zehner
-            "H": -2,  # Hunderter
-            "T": -3,  # Tausender
-            "ZT": -4,  # Zehntausender
-            "HT": -5,  # Hunderttausender
-            "M": -6,  # Million
-        }
-
-        if place not in places_map:
+        entry = _PLACES.get(place)
+        if entry is None:
             return value
 
-        decimals = places_map[place]
+        quantum, factor = entry
         d = Decimal(str(value))
-
-        if decimals >= 0:
-            return float(_quantize(d, decimals))
-        factor = Decimal("10") ** (-decimals)
+        if factor is None:
+            return float(d.quantize(quantum, rounding=ROUND_HALF_UP))
         q = (d / factor).to_integral_value(rounding=ROUND_HALF_UP)
         return float(q * factor)
 
@@ -213,58 +353,54 @@ class MathSolver:
 class QualityControl:
     """Qualitätskontrolle für generierte Aufgaben."""
 
+    history_size = 5
+    template_history_size = 3
+
     def __init__(self):
-        self.used_templates = []
-        self.used_numbers = []
+        # Ringpuffer: nur die letzten Einträge werden verglichen
+        self.used_templates: deque[str] = deque(maxlen=self.template_history_size)
+        self.used_numbers: deque[tuple[float, ...]] = deque(maxlen=self.history_size)
         self.similarity_threshold = 0.7
 
-    def check_similarity(self, numbers: Sequence[float]) -> bool:
-        """Prüft ob Zahlen zu ähnlich zu vorherigen sind."""
+    @staticmethod
+    def _as_sorted(numbers: Sequence[float]) -> tuple[float, ...]:
+        """Normalisiert Zahlen zu einem sortierten float-Tupel."""
         try:
-            numbers = list(map(float, numbers))
+            return tuple(sorted(map(float, numbers)))
         except Exception:
-            numbers = []
-        if not self.used_numbers:
-            return True
+            return ()
 
-        for prev_numbers in self.used_numbers[-5:]:  # Check last 5
-            if (
-                self._calculate_similarity(numbers, prev_numbers)
-                > self.similarity_threshold
-            ):
+    def _is_distinct(self, key: tuple[float, ...]) -> bool:
+        """Prüft ein bereits sortiertes Tupel gegen den Verlauf.
+
+        Zwei gleich lange Tupel gelten als zu ähnlich, wenn mehr als
+        ``similarity_threshold`` ihrer Werte paarweise um weniger als 10 %
+        abweichen. Ein leeres Tupel enthält keine vergleichbaren Werte und gilt
+        daher immer als verschieden.
+        """
+        n = len(key)
+        if not n:
+            return True
+        threshold = self.similarity_threshold
+        for prev in self.used_numbers:
+            if len(prev) != n:
+                continue
+            matches = sum(abs(a - b) < max(a, b) * 0.1 for a, b in zip(key, prev))
+            if matches / n > threshold:
                 return False
         return True
 
-    def _calculate_similarity(
-        self, list1: Sequence[float], list2: Sequence[float]
-    ) -> float:
-        """Berechnet Ähnlichkeit zweier Zahlenlisten."""
-        try:
-            list1 = list(map(float, list1))
-            list2 = list(map(float, list2))
-        except Exception:
-            return 0
-        if len(list1) != len(list2):
-            return 0
-
-        matches = sum(
-            1
-            for a, b in zip(sorted(list1), sorted(list2))
-            if abs(a - b) < max(a, b) * 0.1
-        )
-        return matches / len(list1)
-
-    def register_numbers(self, numbers: Sequence[float]):
-        """Registriert verwendete Zahlen."""
-        try:
-            numbers = list(map(float, numbers))
-        except Exception:
-            numbers = []
-        self.used_numbers.append(numbers)
+    def accept_numbers(self, numbers: Sequence[float]) -> bool:
+        """Prüft und registriert Zahlen in einem Schritt mit nur einer Sortierung."""
+        key = self._as_sorted(numbers)
+        if not self._is_distinct(key):
+            return False
+        self.used_numbers.append(key)
+        return True
 
     def check_template(self, template_id: str) -> bool:
         """Prüft ob Template kürzlich verwendet wurde."""
-        if template_id in self.used_templates[-3:]:
+        if template_id in self.used_templates:
             return False
         return True
 
@@ -305,12 +441,12 @@ class GeometryCalculator:
     @staticmethod
     def circle_area(radius: float) -> float:
         """Fläche eines Kreises."""
-        return math.pi * radius**2
+        return math.pi * (radius * radius)
 
     @staticmethod
     def circle_perimeter(radius: float) -> float:
         """Umfang eines Kreises."""
-        return 2 * math.pi * radius
+        return math.tau * radius
 
     @staticmethod
     def l_shape_area(l1: float, w1: float, l2: float, w2: float) -> float:
@@ -319,18 +455,17 @@ class GeometryCalculator:
 
     @staticmethod
     def l_shape_perimeter(l1: float, w1: float, l2: float, w2: float) -> float:
-        """Umfang einer L-Form."""
-        pts = [
-            (0, 0),
-            (l1, 0),
-            (l1, w1),
-            (l1 - l2, w1),
-            (l1 - l2, w1 - w2),
-            (0, w1 - w2),
-        ]
-        return sum(
-            math.hypot(pts[(i + 1) % 6][0] - pts[i][0], pts[(i + 1) % 6][1] - pts[i][1])
-            for i in range(6)
+        """Umfang einer L-Form.
+
+        Der Umriss läuft über (0, 0), (l1, 0), (l1, w1), (l1 - l2, w1),
+        (l1 - l2, w1 - w2) und (0, w1 - w2); alle Kanten sind achsenparallel,
+        daher ist jede Kantenlänge der Betrag einer Koordinatendifferenz.
+        Liegt der Ansatz innerhalb des Hauptteils, ist das 2 * (l1 + w1).
+        """
+        if 0 <= l2 <= l1 and 0 <= w2 <= w1:
+            return float(2 * (l1 + w1))
+        return float(
+            abs(l1) + abs(w1) + abs(l2) + abs(w2) + abs(l1 - l2) + abs(w1 - w2)
         )
 
     @staticmethod
@@ -344,6 +479,18 @@ class GeometryCalculator:
         return 2 * (length * width + length * height + width * height)
 
 
+def _build_factor_table(
+    conversions: dict[str, float], dimensions: Sequence[Sequence[str]]
+) -> dict[tuple[str, str], float]:
+    """Berechnet alle Umrechnungsfaktoren innerhalb derselben Größenart."""
+    return {
+        (von, nach): conversions[von] / conversions[nach]
+        for units in dimensions
+        for von in units
+        for nach in units
+    }
+
+
 class UnitConverter:
     """Konvertiert zwischen verschiedenen Einheiten."""
 
@@ -385,34 +532,361 @@ class UnitConverter:
         "d": 86400,
     }
 
+    dimensions = (
+        ("mm", "cm", "dm", "m", "km"),
+        ("mm²", "cm²", "dm²", "m²", "km²", "ha", "a"),
+        ("mm³", "cm³", "dm³", "m³", "ml", "cl", "dl", "l", "hl"),
+        ("mg", "g", "kg", "t"),
+        ("s", "min", "h", "d"),
+    )
+
+    # Direkte Faktoren (von, nach) -> Multiplikator, schreibgeschützt
+    _factors = MappingProxyType(_build_factor_table(conversions, dimensions))
+
     @classmethod
     def convert(cls, value: float, from_unit: str, to_unit: str) -> float | None:
-        """Konvertiert zwischen Einheiten."""
-        if from_unit not in cls.conversions or to_unit not in cls.conversions:
+        """Konvertiert zwischen Einheiten derselben Größenart."""
+        factor = cls._factors.get((from_unit, to_unit))
+        if factor is None:
             return None
-
-        # Konvertiere zur Basiseinheit und dann zur Zieleinheit
-        base_value = value * cls.conversions[from_unit]
-        result = base_value / cls.conversions[to_unit]
+        return value * factor
+
+
+# Zahlwörter für _zahl_zu_text
+_EINER_NAMEN = (
+    "",
+    "ein",
+    "zwei",
+    "drei",
+    "vier",
+    "fünf",
+    "sechs",
+    "sieben",
+    "acht",
+    "neun",
+)
+_ZEHNER_NAMEN = (
+    "",
+    "zehn",
+    "zwanzig",
+    "dreißig",
+    "vierzig",
+    "fünfzig",
+    "sechzig",
+    "siebzig",
+    "achtzig",
+    "neunzig",
+)
+_ZAHL_SPEZIAL = {
+    11: "elf",
+    12: "zwölf",
+    13: "dreizehn",
+    14: "vierzehn",
+    15: "fünfzehn",
+    16: "sechzehn",
+    17: "siebzehn",
+    18: "achtzehn",
+    19: "neunzehn",
+}
+
+
+@functools.lru_cache(maxsize=10000)
+def _zahl_text(zahl: int) -> str:
+    """Schreibt ``zahl`` als deutsches Zahlwort aus (gecacht, da rekursiv)."""
+    if zahl == 0:
+        return "null"
+    elif zahl < 10:
+        return _EINER_NAMEN[zahl] if zahl != 1 else "eins"
+    elif 11 <= zahl <= 19:
+        return _ZAHL_SPEZIAL[zahl]
+    elif zahl < 100:
+        z, e = divmod(zahl, 10)
+        if e == 0:
+            return _ZEHNER_NAMEN[z]
+        elif e == 1:
+            return "einund" + _ZEHNER_NAMEN[z]
+        else:
+            return _EINER_NAMEN[e] + "und" + _ZEHNER_NAMEN[z]
+    elif zahl < 1000:
+        h, rest = divmod(zahl, 100)
+        result = _EINER_NAMEN[h] + "hundert"
+        if rest > 0:
+            result += _zahl_text(rest)
+        return result
+    elif zahl < 10000:
+        t, rest = divmod(zahl, 1000)
+        if t == 1:
+            result = "eintausend"
+        else:
+            result = _EINER_NAMEN[t] + "tausend"
+        if rest > 0:
+            result += _zahl_text(rest)
         return result
+    else:
+        # Für größere Zahlen
+        return str(zahl)
+
+
+# ASCII-Skizzen und Flächenzahlen der Raumvorstellungs-Aufgaben
+_KOERPER_ASCII: Final[dict[str, str]] = {
+    "Quader mit Aussparung": (
+        "```\n" "┌───────┐\n" "│ ┌───┐ │\n" "│ └───┘ │\n" "└───────┘\n" "```"
+    ),
+    "L-förmiger Körper": (
+        "```\n" "    ┌───┐\n" "    │   │\n" "┌───┼───┘\n" "│   │\n" "└───┘\n" "```"
+    ),
+    "T-förmiger Körper": (
+        "```\n"
+        "┌───┬───┬───┐\n"
+        "│   │   │   │\n"
+        "└───┼───┼───┘\n"
+        "    │   │\n"
+        "    └───┘\n"
+        "```"
+    ),
+    "Treppenförmiger Körper": (
+        "```\n" "┌───┐\n" "│   └───┐\n" "│       │\n" "└───────┘\n" "```"
+    ),
+    "Würfel mit quadratischer Bohrung": (
+        "```\n" "┌───┐\n" "│┌─┐│\n" "│└─┘│\n" "└───┘\n" "```"
+    ),
+    "U-förmiger Körper": (
+        "```\n"
+        "┌───┐ ┌───┐\n"
+        "│   │ │   │\n"
+        "└───┼─┼───┘\n"
+        "    │ │\n"
+        "    └─┘\n"
+        "```"
+    ),
+    "Z-förmiger Körper": ("```\n" "┌───┐\n" "└─┐ │\n" "  │ └─┐\n" "  └───┘\n" "```"),
+}
+
+_KOERPER_FLAECHEN: Final[dict[str, int]] = {
+    "Würfel": 6,
+    "Quader": 6,
+    "Pyramide (quadratische Grundfläche)": 5,
+    "Prisma (dreieckige Grundfläche)": 5,
+    "Tetraeder": 4,
+}
+
+_NETZ_ASCII: Final[dict[str, str]] = {
+    "Würfel": (
+        "```\n" "    ┌───┐\n" "┌───┼───┼───┐\n" "└───┼───┼───┘\n" "    └───┘\n" "```"
+    ),
+    "Quader": (
+        "```\n"
+        "    ┌─────┐\n"
+        "┌─────┼─────┼─────┐\n"
+        "└─────┼─────┼─────┘\n"
+        "    └─────┘\n"
+        "```"
+    ),
+    "Pyramide (quadratische Grundfläche)": (
+        "```\n" "  ▲\n" " ▲▲▲\n" "▲▲▲▲▲\n" "  ◼\n" "```"
+    ),
+}
+
+# Kopf und Spalten der Stellenwerttabelle (ohne Kommaspalte)
+_STELLENWERT_KOPF: Final = (
+    "Stellenwerttabelle:\n"
+    "| Nr | HT | ZT | T | H | Z | E | , | z | h | t |\n"
+    "|----|----|----|----|----|----|----|----|----|----|----|\n"
+)
+_STELLENWERT_SPALTEN: Final = ("HT", "ZT", "T", "H", "Z", "E", "z", "h", "t")
+
+# Nachkommastellen der Einheitenlösungen je Größenbereich (per bisect_right):
+# < 0,01 -> 6, < 1 -> 4, < 10000 -> 2, sonst ganzzahlig
+_EINHEIT_SCHWELLEN: Final = (0.01, 1, 10000)
+_EINHEIT_NACHKOMMA: Final = (6, 4, 2, 0)
+
+# Preisschlüssel in AustrianData.preise je Material der Materialaufgaben
+_MATERIAL_PREIS_KEYS: Final[dict[str, str]] = {
+    "stahl": "stahl_kg",
+    "aluminium": "aluminium_kg",
+    "kupfer": "kupfer_kg",
+    "beton": "beton_m3",
+}
+
+_KOERPER_ASCII_KEYS: Final = tuple(_KOERPER_ASCII)
+_KOERPER_FLAECHEN_KEYS: Final = tuple(_KOERPER_FLAECHEN)
+
+
+@dataclass(frozen=True, slots=True)
+class Aufgabe:
+    """Generierte Aufgabe mit Lösung und Lösungsweg."""
+
+    aufgabe: str
+    loesung: str
+    erklaerung: str
+
+    def __iter__(self):
+        # Erlaubt weiterhin ``aufgabe, loesung, erklaerung = ...``
+        return iter((self.aufgabe, self.loesung, self.erklaerung))
+
+
+@dataclass(frozen=True, slots=True)
+class AufgabenLoesung:
+    """Detaillierte Lösung einer Testaufgabe (Eintrag des JSON-Exports)."""
+
+    nummer: str
+    aufgabe: str
+    loesung: str
+    erklaerung: str
+    punkte: int
+
+    def to_dict(self) -> dict[str, str | int]:
+        return {
+            "nummer": self.nummer,
+            "aufgabe": self.aufgabe,
+            "loesung": self.loesung,
+            "erklaerung": self.erklaerung,
+            "punkte": self.punkte,
+        }
+
+
+# Lösungswege der Grundrechenarten; Platzhalter erhalten bereits formatierte Zahlen
+_EXPL_ADDITION = "Schritt 1: {ab}\nSchritt 2: {ab} - {c} = {r}"
+_EXPL_SUBTRAKTION = "Schritt 1: {a} - {b} = {ab}\nSchritt 2: {ab} - {c} = {r}"
+_EXPL_KLAMMER_PLUS = (
+    "Schritt 1: {c} · {d} = {cd}\n"
+    "Schritt 2: {b} + {cd} = {bcd}\n"
+    "Schritt 3: {a} - {bcd} = {r}"
+)
+_EXPL_KLAMMER_MINUS = (
+    "Schritt 1: {a} + {b} = {ab}\n"
+    "Schritt 2: {ab} · {c} = {abc}\n"
+    "Schritt 3: {abc} - {d} = {r}"
+)
+_EXPL_KLAMMER_MAL = (
+    "Schritt 1: {c} + {d} = {cd}\n"
+    "Schritt 2: {b} · {cd} = {bcd}\n"
+    "Schritt 3: {a} + {bcd} = {r}"
+)
+_EXPL_VERSCHACHTELT1 = (
+    "Schritt 1: {d} - {e} = {inner}\n"
+    "Schritt 2: {c} · {inner} = {mult}\n"
+    "Schritt 3: {b} + {mult} = {bracket}\n"
+    "Schritt 4: {a} - {bracket} = {rest}\n"
+    "Schritt 5: {rest} + {f} = {r}"
+)
+_EXPL_VERSCHACHTELT2 = (
+    "Schritt 1: {b} · {c} = {mult}\n"
+    "Schritt 2: {a} - {mult} = {first}\n"
+    "Schritt 3: {d} + {e} = {second}\n"
+    "Schritt 4: {second} : {f} = {div}\n"
+    "Schritt 5: {first} + {div} = {r}"
+)
+_EXPL_NEGATIV = (
+    "Schritt 1: (-{b}) · {c} = {neg_mult}\n"
+    "Schritt 2: {d} + {e} = {sum_de}\n"
+    "Schritt 3: {sum_de} : {f} = {div}\n"
+    "Schritt 4: -{a} + {neg_mult} = {partial}\n"
+    "Schritt 5: {partial} - {div} = {r}"
+)
 
 
 class AufgabenGenerator:
     """Generiert verschiedene Aufgabentypen."""
 
-    def __init__(self, schwierigkeit: Schwierigkeit = Schwierigkeit.MITTEL):
+    __slots__ = (
+        "schwierigkeit",
+        "_rng",
+        "quality_control",
+        "austrian_data",
+        "math_solver",
+        "geometry",
+        "converter",
+        "_berufe",
+        "_materialien",
+        "_preise",
+        "_traeger",
+        "_templates_leicht",
+        "_templates_mittel",
+        "_templates_schwer",
+        "_templates_text_mittel",
+        "_templates_text_schwer",
+    )
+
+    def __init__(
+        self,
+        schwierigkeit: Schwierigkeit = Schwierigkeit.MITTEL,
+        seed: int | None = None,
+    ):
         self.schwierigkeit = schwierigkeit
+        # Eigener Zufallsgenerator: reproduzierbar per Seed, ohne globalen Zustand
+        self._rng = random.Random(seed)
         self.quality_control = QualityControl()
         self.austrian_data = AustrianData()
         self.math_solver = MathSolver()
         self.geometry = GeometryCalculator()
         self.converter = UnitConverter()
+        daten = self.austrian_data
+        # Je Beruf (Anzeigename, Gehalt min, Gehalt max, Stundenbereich)
+        self._berufe = tuple(
+            (daten.beruf_labels[k], b["gehalt_min"], b["gehalt_max"], b["stunden"])
+            for k, b in daten.berufe.items()
+        )
+        # Nur Materialien mit Preisangabe kommen für Materialaufgaben in Frage;
+        # je Material (Anzeigename, Dichte, Dichte-Einheit, Preis pro kg?, Preis)
+        self._materialien = tuple(
+            (
+                m.replace("_", " ").title(),
+                d["dichte"],
+                d["einheit"],
+                _MATERIAL_PREIS_KEYS[m].endswith("_kg"),
+                daten.preise[_MATERIAL_PREIS_KEYS[m]],
+            )
+            for m, d in daten.materialien.items()
+            if m in _MATERIAL_PREIS_KEYS
+        )
+        self._preise = daten.preise
+        # Trägermaterialien der Volumenaufgabe: (Anzeigename, Dichte, Preis/kg)
+        self._traeger = tuple(
+            (m.title(), daten.materialien[m]["dichte"], daten.preise[f"{m}_kg"])
+            for m in ("stahl", "aluminium")
+        )
+        # Template-Auswahl je Schwierigkeitsstufe, einmal pro Generator gebunden
+        self._templates_leicht = (
+            self._template_addition,
+            self._template_subtraktion,
+            self._template_multiplikation,
+            self._template_division,
+        )
+        self._templates_mittel = (
+            self._template_klammer_plus,
+            self._template_klammer_minus,
+            self._template_klammer_mal,
+        )
+        self._templates_schwer = (
+            self._template_verschachtelt1,
+            self._template_verschachtelt2,
+            self._template_negativ,
+        )
+        self._templates_text_mittel = (
+            self._template_gehalt,
+            self._template_material,
+            self._template_produktion,
+            self._template_energie,
+        )
+        self._templates_text_schwer = (
+            self._template_pumpsystem,
+            self._template_mischung,
+            self._template_logistik,
+            self._template_personalplanung,
+        )
+
+    def _draw(self, ranges: Sequence[tuple[int, int]]) -> list[int]:
+        """Zieht je eine ganze Zahl aus den geschlossenen Bereichen ``ranges``."""
+        randrange = self._rng.randrange
+        return [randrange(lo, hi + 1) for lo, hi in ranges]
 
-    def _register_task(self, template_id: str, numbers: list[int]) -> bool:
-        if not self.quality_control.check_similarity(numbers):
+    def _register_task(self, template_id: str, numbers: Sequence[float]) -> bool:
+        """Registriert eine Aufgabe, sofern sie sich von den letzten unterscheidet."""
+        qc = self.quality_control
+        if not qc.accept_numbers(numbers):
             return False
-        self.quality_control.register_template(template_id)
-        self.quality_control.register_numbers(numbers)
+        qc.register_template(template_id)
         return True
 
     @staticmethod
@@ -449,7 +923,7 @@ class AufgabenGenerator:
                 return num, den
         return scales[-1]
 
-    def generate_grundrechnung(self, punkte: int) -> tuple[str, str, str]:
+    def generate_grundrechnung(self, punkte: int) -> Aufgabe:
         """Generiert Grundrechenaufgabe."""
         if punkte <= 2:  # Leicht
             return self._grundrechnung_leicht()
@@ -458,70 +932,48 @@ class AufgabenGenerator:
         else:  # Schwer
             return self._grundrechnung_schwer()
 
-    def _grundrechnung_leicht(self) -> tuple[str, str, str]:
+    def _grundrechnung_leicht(self) -> Aufgabe:
         """Leichte Grundrechenaufgabe."""
-        templates = [
-            lambda: self._template_addition(),
-            lambda: self._template_subtraktion(),
-            lambda: self._template_multiplikation(),
-            lambda: self._template_division(),
-        ]
-        return random.choice(templates)()
+        return self._rng.choice(self._templates_leicht)()
 
-    def _template_addition(self) -> tuple[str, str, str]:
+    def _template_addition(self) -> Aufgabe:
         """Addition Template."""
+        if self.schwierigkeit == Schwierigkeit.EINFACH:
+            ranges = ((50, 500), (20, 200), (10, 100))
+        else:
+            ranges = ((100, 999), (50, 500), (20, 300))
         while True:
-            a = (
-                random.randint(50, 500)
-                if self.schwierigkeit == Schwierigkeit.EINFACH
-                else random.randint(100, 999)
-            )
-            b = (
-                random.randint(20, 200)
-                if self.schwierigkeit == Schwierigkeit.EINFACH
-                else random.randint(50, 500)
-            )
-            c = (
-                random.randint(10, 100)
-                if self.schwierigkeit == Schwierigkeit.EINFACH
-                else random.randint(20, 300)
-            )
+            a, b, c = self._draw(ranges)
             if self._register_task("grundrechnung/addition", [a, b, c]):
                 break
 
         aufgabe = f"{a} + {b} - {c}"
         result = a + b - c
         loesung = fmt(result)
-        erklaerung = (
-            f"Schritt 1: {fmt(a + b)}\nSchritt 2: {fmt(a + b)} - {fmt(c)} = {loesung}"
-        )
+        erklaerung = _EXPL_ADDITION.format(ab=fmt(a + b), c=fmt(c), r=loesung)
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_subtraktion(self) -> tuple[str, str, str]:
+    def _template_subtraktion(self) -> Aufgabe:
         """Subtraktion Template."""
         while True:
-            a = random.randint(500, 1000)
-            b = random.randint(100, 400)
-            c = random.randint(50, 200)
+            a, b, c = self._draw(((500, 1000), (100, 400), (50, 200)))
             if self._register_task("grundrechnung/subtraktion", [a, b, c]):
                 break
 
         aufgabe = f"{a} - {b} - {c}"
         result = a - b - c
         loesung = fmt(result)
-        erklaerung = (
-            f"Schritt 1: {fmt(a)} - {fmt(b)} = {fmt(a - b)}\n"
-            f"Schritt 2: {fmt(a - b)} - {fmt(c)} = {loesung}"
+        erklaerung = _EXPL_SUBTRAKTION.format(
+            a=fmt(a), b=fmt(b), c=fmt(c), ab=fmt(a - b), r=loesung
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_multiplikation(self) -> tuple[str, str, str]:
+    def _template_multiplikation(self) -> Aufgabe:
         """Multiplikation Template."""
         while True:
-            a = random.randint(12, 25)
-            b = random.randint(3, 12)
+            a, b = self._draw(((12, 25), (3, 12)))
             if self._register_task("grundrechnung/multiplikation", [a, b]):
                 break
 
@@ -530,13 +982,12 @@ class AufgabenGenerator:
         loesung = fmt(result)
         erklaerung = f"{fmt(a)} · {fmt(b)} = {loesung}"
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_division(self) -> tuple[str, str, str]:
+    def _template_division(self) -> Aufgabe:
         """Division Template."""
         while True:
-            b = random.randint(5, 15)
-            result = random.randint(10, 50)
+            b, result = self._draw(((5, 15), (10, 50)))
             a = b * result
             if self._register_task("grundrechnung/division", [a, b]):
                 break
@@ -545,98 +996,88 @@ class AufgabenGenerator:
         loesung = fmt(result)
         erklaerung = f"{fmt(a)} : {fmt(b)} = {loesung}"
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _grundrechnung_mittel(self) -> tuple[str, str, str]:
+    def _grundrechnung_mittel(self) -> Aufgabe:
         """Mittlere Grundrechenaufgabe mit Klammern."""
-        templates = [
-            lambda: self._template_klammer_plus(),
-            lambda: self._template_klammer_minus(),
-            lambda: self._template_klammer_mal(),
-        ]
-        return random.choice(templates)()
+        return self._rng.choice(self._templates_mittel)()
 
-    def _template_klammer_plus(self) -> tuple[str, str, str]:
+    def _template_klammer_plus(self) -> Aufgabe:
         """Klammer mit Addition."""
         while True:
-            a = random.randint(80, 150)
-            b = random.randint(10, 30)
-            c = random.randint(3, 8)
-            d = random.randint(5, 15)
+            a, b, c, d = self._draw(((80, 150), (10, 30), (3, 8), (5, 15)))
             if self._register_task("grundrechnung/klammer_plus", [a, b, c, d]):
                 break
 
         aufgabe = f"{a} - ({b} + {c} · {d})"
         result = a - (b + c * d)
         loesung = fmt(result)
-        erklaerung = (
-            f"Schritt 1: {fmt(c)} · {fmt(d)} = {fmt(c * d)}\n"
-            f"Schritt 2: {fmt(b)} + {fmt(c * d)} = {fmt(b + c * d)}\n"
-            f"Schritt 3: {fmt(a)} - {fmt(b + c * d)} = {loesung}"
+        erklaerung = _EXPL_KLAMMER_PLUS.format(
+            a=fmt(a),
+            b=fmt(b),
+            c=fmt(c),
+            d=fmt(d),
+            cd=fmt(c * d),
+            bcd=fmt(b + c * d),
+            r=loesung,
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_klammer_minus(self) -> tuple[str, str, str]:
+    def _template_klammer_minus(self) -> Aufgabe:
         """Klammer mit Subtraktion."""
         while True:
-            a = random.randint(20, 40)
-            b = random.randint(10, 25)
-            c = random.randint(2, 6)
-            d = random.randint(10, 30)
+            a, b, c, d = self._draw(((20, 40), (10, 25), (2, 6), (10, 30)))
             if self._register_task("grundrechnung/klammer_minus", [a, b, c, d]):
                 break
 
         aufgabe = f"({a} + {b}) · {c} - {d}"
         result = (a + b) * c - d
         loesung = fmt(result)
-        erklaerung = (
-            f"Schritt 1: {fmt(a)} + {fmt(b)} = {fmt(a + b)}\n"
-            f"Schritt 2: {fmt(a + b)} · {fmt(c)} = {fmt((a + b) * c)}\n"
-            f"Schritt 3: {fmt((a + b) * c)} - {fmt(d)} = {loesung}"
+        erklaerung = _EXPL_KLAMMER_MINUS.format(
+            a=fmt(a),
+            b=fmt(b),
+            c=fmt(c),
+            d=fmt(d),
+            ab=fmt(a + b),
+            abc=fmt((a + b) * c),
+            r=loesung,
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_klammer_mal(self) -> tuple[str, str, str]:
+    def _template_klammer_mal(self) -> Aufgabe:
         """Klammer mit Multiplikation."""
         while True:
-            a = random.randint(100, 200)
-            b = random.randint(5, 15)
-            c = random.randint(3, 8)
-            d = random.randint(20, 50)
+            a, b, c, d = self._draw(((100, 200), (5, 15), (3, 8), (20, 50)))
             if self._register_task("grundrechnung/klammer_mal", [a, b, c, d]):
                 break
 
         aufgabe = f"{a} + {b} · ({c} + {d})"
         result = a + b * (c + d)
         loesung = fmt(result)
-        erklaerung = (
-            f"Schritt 1: {fmt(c)} + {fmt(d)} = {fmt(c + d)}\n"
-            f"Schritt 2: {fmt(b)} · {fmt(c + d)} = {fmt(b * (c + d))}\n"
-            f"Schritt 3: {fmt(a)} + {fmt(b * (c + d))} = {loesung}"
+        erklaerung = _EXPL_KLAMMER_MAL.format(
+            a=fmt(a),
+            b=fmt(b),
+            c=fmt(c),
+            d=fmt(d),
+            cd=fmt(c + d),
+            bcd=fmt(b * (c + d)),
+            r=loesung,
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _grundrechnung_schwer(self) -> tuple[str, str, str]:
+    def _grundrechnung_schwer(self) -> Aufgabe:
         """Schwere Grundrechenaufgabe mit verschachtelten Klammern."""
-        templates = [
-            lambda: self._template_verschachtelt1(),
-            lambda: self._template_verschachtelt2(),
-            lambda: self._template_negativ(),
-        ]
-        return random.choice(templates)()
+        return self._rng.choice(self._templates_schwer)()
 
-    def _template_verschachtelt1(self) -> tuple[str, str, str]:
+    def _template_verschachtelt1(self) -> Aufgabe:
         """Verschachtelte Klammern Typ 1."""
         while True:
-            a = random.randint(100, 200)
-            b = random.randint(8, 20)
-            c = random.randint(2, 6)
-            d = random.randint(10, 25)
-            e = random.randint(3, 8)
-            f = random.randint(10, 40)
+            a, b, c, d, e, f = self._draw(
+                ((100, 200), (8, 20), (2, 6), (10, 25), (3, 8), (10, 40))
+            )
             if self._register_task("grundrechnung/verschachtelt1", [a, b, c, d, e, f]):
                 break
 
@@ -647,25 +1088,28 @@ class AufgabenGenerator:
         result = a - bracket + f
 
         loesung = fmt(result)
-        erklaerung = (
-            f"Schritt 1: {fmt(d)} - {fmt(e)} = {fmt(inner)}\n"
-            f"Schritt 2: {fmt(c)} · {fmt(inner)} = {fmt(mult)}\n"
-            f"Schritt 3: {fmt(b)} + {fmt(mult)} = {fmt(bracket)}\n"
-            f"Schritt 4: {fmt(a)} - {fmt(bracket)} = {fmt(a - bracket)}\n"
-            f"Schritt 5: {fmt(a - bracket)} + {fmt(f)} = {loesung}"
+        erklaerung = _EXPL_VERSCHACHTELT1.format(
+            a=fmt(a),
+            b=fmt(b),
+            c=fmt(c),
+            d=fmt(d),
+            e=fmt(e),
+            f=fmt(f),
+            inner=fmt(inner),
+            mult=fmt(mult),
+            bracket=fmt(bracket),
+            rest=fmt(a - bracket),
+            r=loesung,
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_verschachtelt2(self) -> tuple[str, str, str]:
+    def _template_verschachtelt2(self) -> Aufgabe:
         """Verschachtelte Klammern Typ 2."""
         while True:
-            a = random.randint(150, 250)
-            b = random.randint(20, 40)
-            c = random.randint(3, 7)
-            d = random.randint(5, 15)
-            e = random.randint(10, 30)
-            f = random.randint(2, 5)
+            a, b, c, d, e, f = self._draw(
+                ((150, 250), (20, 40), (3, 7), (5, 15), (10, 30), (2, 5))
+            )
             if self._register_task("grundrechnung/verschachtelt2", [a, b, c, d, e, f]):
                 break
 
@@ -677,46 +1121,53 @@ class AufgabenGenerator:
         result = first_bracket + div
 
         loesung = fmt(result)
-        erklaerung = (
-            f"Schritt 1: {fmt(b)} · {fmt(c)} = {fmt(mult)}\n"
-            f"Schritt 2: {fmt(a)} - {fmt(mult)} = {fmt(first_bracket)}\n"
-            f"Schritt 3: {fmt(d)} + {fmt(e)} = {fmt(second_bracket)}\n"
-            f"Schritt 4: {fmt(second_bracket)} : {fmt(f)} = {fmt(div)}\n"
-            f"Schritt 5: {fmt(first_bracket)} + {fmt(div)} = {loesung}"
+        erklaerung = _EXPL_VERSCHACHTELT2.format(
+            a=fmt(a),
+            b=fmt(b),
+            c=fmt(c),
+            d=fmt(d),
+            e=fmt(e),
+            f=fmt(f),
+            mult=fmt(mult),
+            first=fmt(first_bracket),
+            second=fmt(second_bracket),
+            div=fmt(div),
+            r=loesung,
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_negativ(self) -> tuple[str, str, str]:
+    def _template_negativ(self) -> Aufgabe:
         """Mit negativen Zahlen."""
         while True:
-            a = random.randint(20, 50)
-            b = random.randint(2, 8)
-            c = random.randint(3, 9)
-            d = random.randint(15, 40)
-            e = random.randint(5, 20)
-            f = random.randint(2, 6)
+            a, b, c, d, e, f = self._draw(
+                ((20, 50), (2, 8), (3, 9), (15, 40), (5, 20), (2, 6))
+            )
             if self._register_task("grundrechnung/negativ", [a, b, c, d, e, f]):
                 break
 
         aufgabe = f"-{a} + (-{b}) · {c} - ({d} + {e}) : {f}"
-        neg_mult = -b * c
-        sum_de = d + e
-        div = sum_de / f
-        result = -a + neg_mult - div
-
-        loesung = fmt(result)
-        erklaerung = (
-            f"Schritt 1: (-{fmt(b)}) · {fmt(c)} = {fmt(neg_mult)}\n"
-            f"Schritt 2: {fmt(d)} + {fmt(e)} = {fmt(sum_de)}\n"
-            f"Schritt 3: {fmt(sum_de)} : {fmt(f)} = {fmt(div)}\n"
-            f"Schritt 4: -{fmt(a)} + {fmt(neg_mult)} = {fmt(-a + neg_mult)}\n"
-            f"Schritt 5: {fmt(-a + neg_mult)} - {fmt(div)} = {loesung}"
+        partial = -a - b * c
+        div = (d + e) / f
+
+        loesung = fmt(partial - div)
+        erklaerung = _EXPL_NEGATIV.format(
+            a=fmt(a),
+            b=fmt(b),
+            c=fmt(c),
+            d=fmt(d),
+            e=fmt(e),
+            f=fmt(f),
+            neg_mult=fmt(-b * c),
+            sum_de=fmt(d + e),
+            div=fmt(div),
+            partial=fmt(partial),
+            r=loesung,
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def generate_bruchaufgabe(self, punkte: int) -> tuple[str, str, str]:
+    def generate_bruchaufgabe(self, punkte: int) -> Aufgabe:
         """Generiert Bruchaufgabe mit Nenner < 100."""
         if punkte <= 4:
             niveau = 1 if self.schwierigkeit == Schwierigkeit.EINFACH else 2
@@ -726,28 +1177,17 @@ class AufgabenGenerator:
         # Generiere Brüche mit kleinen Nennern
         max_denominator = 12 if niveau == 1 else 20 if niveau == 2 else 30
 
-        # Stelle sicher, dass Nenner unterschiedlich sind (kein gemeinsamer Nenner von Anfang an)
-        d1 = random.randint(2, max_denominator)
-        d2 = random.randint(2, max_denominator)
-        while d2 == d1 or (d1 % d2 == 0) or (d2 % d1 == 0):
-            d2 = random.randint(2, max_denominator)
-
-        # Prüfe ob gemeinsamer Nenner < 100
-        lcm = (d1 * d2) // math.gcd(d1, d2)
-        if lcm >= 100:
-            # Versuche kleinere Nenner
-            d1 = random.randint(2, 10)
-            d2 = random.randint(2, 12)
-            while d2 == d1:
-                d2 = random.randint(2, 12)
-            lcm = (d1 * d2) // math.gcd(d1, d2)
-
-        n1 = random.randint(1, d1 - 1)
-        n2 = random.randint(1, d2 - 1)
+        # Nenner unterschiedlich, ohne gemeinsamen Nenner von Anfang an und mit
+        # gemeinsamem Nenner < 100: direkt aus der Tabelle statt per Verwerfen
+        d1, d2 = self._rng.choice(_BRUCH_NENNERPAARE[max_denominator])
+        lcm = _LCM[d1][d2]
+
+        n1 = self._rng.randint(1, d1 - 1)
+        n2 = self._rng.randint(1, d2 - 1)
 
         if niveau == 1:
             # Einfache Addition/Subtraktion
-            operation = random.choice(["+", "-"])
+            operation = self._rng.choice(("+", "-"))
             f1 = Fraction(n1, d1)
             f2 = Fraction(n2, d2)
 
@@ -777,7 +1217,7 @@ class AufgabenGenerator:
 
         elif niveau == 2:
             # Mit gemischten Zahlen
-            whole = random.randint(1, 3)
+            whole = self._rng.randint(1, 3)
             f1 = Fraction(whole * d1 + n1, d1)
             f2 = Fraction(n2, d2)
 
@@ -799,7 +1239,7 @@ class AufgabenGenerator:
 
         else:
             # Schwer mit Multiplikation/Division
-            operation = random.choice(["·", ":"])
+            operation = self._rng.choice(("·", ":"))
             f1 = Fraction(n1, d1)
             f2 = Fraction(n2, d2)
 
@@ -827,20 +1267,18 @@ class AufgabenGenerator:
             else:
                 loesung = f"{result.numerator}/{result.denominator}"
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def generate_gleichung(
-        self, schwer: bool = False, var: str = "x"
-    ) -> tuple[str, str, str]:
+    def generate_gleichung(self, schwer: bool = False, var: str = "x") -> Aufgabe:
         """Generiert Gleichung."""
         if not schwer:
             a1, b1, c1 = (
-                random.randint(2, 5),
-                random.randint(1, 4),
-                random.randint(2, 10),
+                self._rng.randint(2, 5),
+                self._rng.randint(1, 4),
+                self._rng.randint(2, 10),
             )
-            a2, b2 = random.randint(2, 4), random.randint(1, 8)
-            a3, b3 = random.randint(1, 3), random.randint(2, 8)
+            a2, b2 = self._rng.randint(2, 4), self._rng.randint(1, 8)
+            a3, b3 = self._rng.randint(1, 3), self._rng.randint(2, 8)
 
             aufgabe = (
                 f"{a1}({b1}{var} + {c1}) - {a2}({var} - {b2}) + {a3}·({var} + {b3}) = 0"
@@ -858,138 +1296,126 @@ class AufgabenGenerator:
                 erklaerung = f"Die {var}-Terme heben sich auf"
 
         else:
-            a1, b1 = random.randint(2, 4), random.randint(1, 3)
-            dec = random.choice([1.5, 2.5, 0.5])
-            frac_num, frac_den = random.randint(1, 3), random.randint(2, 4)
+            a1, b1 = self._rng.randint(2, 4), self._rng.randint(1, 3)
+            dec = self._rng.choice(_GLEICHUNG_DEZIMALEN)
+            frac_num, frac_den = self._rng.randint(1, 3), self._rng.randint(2, 4)
             c1, d1, e1 = (
-                random.randint(2, 8),
-                random.randint(5, 20),
-                random.randint(2, 8),
+                self._rng.randint(2, 8),
+                self._rng.randint(5, 20),
+                self._rng.randint(2, 8),
             )
 
             aufgabe = f"{a1}({b1}{var} - {dec}) + {frac_num}/{frac_den}·({var} + {c1}) = {d1}/{e1}"
 
-            dec_frac = Fraction(str(dec))
+            dec_frac = _DEC_TO_FRAC[dec]
             frac = Fraction(frac_num, frac_den)
             right = Fraction(d1, e1)
 
-            coeff_x = Fraction(a1 * b1) + frac
-            const = -Fraction(a1) * dec_frac + frac * Fraction(c1)
+            # Ganzzahlen direkt mit den Brüchen verrechnen, ohne Fraction(int)
+            coeff_x = frac + a1 * b1
+            const = frac * c1 - dec_frac * a1
 
             x = (right - const) / coeff_x
             loesung = f"{var} = {fmt(float(x), 3)}"
             erklaerung = f"Mit Brüchen auflösen: {fmt(float(coeff_x), 3)}{var} + {fmt(float(const), 3)} = {fmt(float(right), 3)}"
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def generate_textaufgabe(self, punkte: int) -> tuple[str, str, str]:
+    def generate_textaufgabe(self, punkte: int) -> Aufgabe:
         """Generiert realistische Textaufgabe."""
         if punkte <= 10:
             return self._textaufgabe_mittel()
         else:
             return self._textaufgabe_schwer()
 
-    def _textaufgabe_mittel(self) -> tuple[str, str, str]:
+    def _textaufgabe_mittel(self) -> Aufgabe:
         """Mittlere Textaufgabe aus Handwerk/Technik."""
-        templates = [
-            self._template_gehalt,
-            self._template_material,
-            self._template_produktion,
-            self._template_energie,
-        ]
-        return random.choice(templates)()
+        return self._rng.choice(self._templates_text_mittel)()
 
-    def _template_gehalt(self) -> tuple[str, str, str]:
+    def _template_gehalt(self) -> Aufgabe:
         """Gehaltsberechnung."""
         while True:
-            beruf = random.choice(list(self.austrian_data.berufe.keys()))
-            beruf_data = self.austrian_data.berufe[beruf]
-            gehalt = random.randint(beruf_data["gehalt_min"], beruf_data["gehalt_max"])
-            stunden_alt = random.randint(*beruf_data["stunden"])
-            stunden_neu = random.randint(30, stunden_alt - 2)
+            beruf, gehalt_min, gehalt_max, stunden = self._rng.choice(self._berufe)
+            gehalt = self._rng.randint(gehalt_min, gehalt_max)
+            stunden_alt = self._rng.randint(*stunden)
+            stunden_neu = self._rng.randint(30, stunden_alt - 2)
             if self._register_task("text/gehalt", [gehalt, stunden_alt, stunden_neu]):
                 break
 
         aufgabe = (
-            f"Ein {beruf.replace('_', '-').title()} verdient {gehalt}€ bei {stunden_alt} Stunden/Woche. "
+            f"Ein {beruf} verdient {gehalt}€ bei {stunden_alt} Stunden/Woche. "
             f"Bei einer Reduktion auf {stunden_neu} Stunden/Woche (gleicher Stundenlohn): "
             f"a) Wie hoch ist das neue Gehalt? b) Um wie viel Prozent sinkt das Gehalt?"
         )
 
+        # Der Stundenlohn kürzt sich heraus: je eine Division auf den Ganzzahlen
         stundenlohn = gehalt / stunden_alt
-        neues_gehalt = stundenlohn * stunden_neu
-        prozent = ((gehalt - neues_gehalt) / gehalt) * 100
+        neues_gehalt = gehalt * stunden_neu / stunden_alt
+        prozent = (stunden_alt - stunden_neu) * 100 / stunden_alt
+
+        lohn_s = fmt(stundenlohn)
+        neu_s = fmt(neues_gehalt)
+        prozent_s = fmt(prozent, 1)
 
-        loesung = f"a) {fmt(neues_gehalt)}€, b) -{fmt(prozent, 1)}%"
+        loesung = f"a) {neu_s}€, b) -{prozent_s}%"
         erklaerung = (
-            f"Stundenlohn = {gehalt}/{stunden_alt} = {fmt(stundenlohn)}€/h. "
-            f"Neues Gehalt = {fmt(stundenlohn)}×{stunden_neu} = {fmt(neues_gehalt)}€. "
-            f"Prozentuale Änderung = ({gehalt} - {fmt(neues_gehalt)})/{gehalt}×100 = {fmt(prozent, 1)}%."
+            f"Stundenlohn = {gehalt}/{stunden_alt} = {lohn_s}€/h. "
+            f"Neues Gehalt = {lohn_s}×{stunden_neu} = {neu_s}€. "
+            f"Prozentuale Änderung = ({gehalt} - {neu_s})/{gehalt}×100 = {prozent_s}%."
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_material(self) -> tuple[str, str, str]:
+    def _template_material(self) -> Aufgabe:
         """Materialverbrauch."""
         while True:
-            material = random.choice(list(self.austrian_data.materialien.keys()))
-            material_data = self.austrian_data.materialien[material]
-            laenge = random.randint(200, 500)
-            breite = random.randint(10, 30)
-            hoehe = random.randint(5, 20)
-            preis_map = {
-                "stahl": "stahl_kg",
-                "aluminium": "aluminium_kg",
-                "kupfer": "kupfer_kg",
-                "beton": "beton_m3",
-                "holz_fichte": None,
-            }
-            mat_key = material.split("_")[0]
-            preis_key = preis_map.get(mat_key)
-            if preis_key is None:
-                material = "stahl"
-                material_data = self.austrian_data.materialien[material]
-                preis_key = "stahl_kg"
+            material, dichte, dichte_einheit, pro_kg, preis_wert = self._rng.choice(
+                self._materialien
+            )
+            laenge = self._rng.randint(200, 500)
+            breite = self._rng.randint(10, 30)
+            hoehe = self._rng.randint(5, 20)
             if self._register_task(
-                "text/material",
-                [laenge, breite, hoehe, self.austrian_data.preise[preis_key]],
+                "text/material", [laenge, breite, hoehe, preis_wert]
             ):
                 break
 
-        preis_wert = self.austrian_data.preise[preis_key]
-        einheit = "€/kg" if preis_key.endswith("_kg") else "€/m³"
+        einheit = "€/kg" if pro_kg else "€/m³"
 
         aufgabe = (
-            f"Ein Werkstück aus {material.replace('_', ' ').title()} hat die Maße "
+            f"Ein Werkstück aus {material} hat die Maße "
             f"{laenge}cm × {breite}cm × {hoehe}cm. "
-            f"Dichte: {material_data['dichte']} {material_data['einheit']}. "
+            f"Dichte: {dichte} {dichte_einheit}. "
             f"Preis: {preis_wert}{einheit}. Berechnen Sie: a) Gewicht b) Materialkosten"
         )
 
         volumen_cm3 = laenge * breite * hoehe
         volumen_dm3 = volumen_cm3 / 1000
-        volumen_m3 = volumen_cm3 / 1_000_000
-        gewicht = volumen_dm3 * material_data["dichte"]
-        if preis_key.endswith("_kg"):
+        gewicht = volumen_dm3 * dichte
+        if pro_kg:
             kosten = gewicht * preis_wert
         else:
-            kosten = volumen_m3 * preis_wert
+            kosten = volumen_cm3 / 1_000_000 * preis_wert
 
-        loesung = f"a) {fmt(gewicht)}kg, b) {fmt(kosten)}€"
+        volumen_s = fmt(volumen_dm3)
+        gewicht_s = fmt(gewicht)
+        kosten_s = fmt(kosten)
+
+        loesung = f"a) {gewicht_s}kg, b) {kosten_s}€"
         erklaerung = (
-            f"Volumen = {laenge}×{breite}×{hoehe} = {volumen_cm3}cm³ = {fmt(volumen_dm3)}dm³. "
-            f"Gewicht = {fmt(volumen_dm3)}×{material_data['dichte']} = {fmt(gewicht)}kg. "
-            f"Kosten = {fmt(gewicht)}×{preis_wert} = {fmt(kosten)}€"
+            f"Volumen = {laenge}×{breite}×{hoehe} = {volumen_cm3}cm³ = {volumen_s}dm³. "
+            f"Gewicht = {volumen_s}×{dichte} = {gewicht_s}kg. "
+            f"Kosten = {gewicht_s}×{preis_wert} = {kosten_s}€"
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_produktion(self) -> tuple[str, str, str]:
+    def _template_produktion(self) -> Aufgabe:
         """Produktionsaufgabe."""
         while True:
-            maschinen = random.randint(3, 8)
-            zeit = random.randint(20, 50)
-            neue_maschinen = random.randint(maschinen + 2, maschinen * 2)
+            maschinen = self._rng.randint(3, 8)
+            zeit = self._rng.randint(20, 50)
+            neue_maschinen = self._rng.randint(maschinen + 2, maschinen * 2)
             if self._register_task(
                 "text/produktion", [maschinen, zeit, neue_maschinen]
             ):
@@ -1011,17 +1437,17 @@ class AufgabenGenerator:
             f"Neue Zeit = {maschinen * zeit}/{neue_maschinen} = {fmt(neue_zeit)}h"
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_energie(self) -> tuple[str, str, str]:
+    def _template_energie(self) -> Aufgabe:
         """Energieverbrauch einer Maschine."""
         while True:
-            leistung = round(random.uniform(1.5, 5.0), 1)
-            stunden = random.randint(4, 8)
+            leistung = round(self._rng.uniform(1.5, 5.0), 1)
+            stunden = self._rng.randint(4, 8)
             if self._register_task("text/energie", [int(leistung * 10), stunden]):
                 break
 
-        preis = self.austrian_data.preise["strom_kwh"]
+        preis = self._preise["strom_kwh"]
         aufgabe = (
             f"Eine Maschine mit {leistung}kW läuft {stunden} Stunden. "
             f"Strompreis: {preis}€/kWh. a) Energieverbrauch? b) Kosten?"
@@ -1030,35 +1456,28 @@ class AufgabenGenerator:
         verbrauch = leistung * stunden
         kosten = verbrauch * preis
 
-        loesung = f"a) {fmt(verbrauch)}kWh, b) {fmt(kosten)}€"
+        verbrauch_s = fmt(verbrauch)
+        kosten_s = fmt(kosten)
+
+        loesung = f"a) {verbrauch_s}kWh, b) {kosten_s}€"
         erklaerung = (
-            f"Verbrauch = {leistung}×{stunden} = {fmt(verbrauch)}kWh. "
-            f"Kosten = {fmt(verbrauch)}×{preis} = {fmt(kosten)}€"
+            f"Verbrauch = {leistung}×{stunden} = {verbrauch_s}kWh. "
+            f"Kosten = {verbrauch_s}×{preis} = {kosten_s}€"
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _textaufgabe_schwer(self) -> tuple[str, str, str]:
+    def _textaufgabe_schwer(self) -> Aufgabe:
         """Schwere mehrstufige Textaufgabe."""
-        templates = [
-            self._template_pumpsystem,
-            self._template_mischung,
-            self._template_logistik,
-            self._template_personalplanung,
-        ]
-        return random.choice(templates)()
+        return self._rng.choice(self._templates_text_schwer)()
 
-    def _template_pumpsystem(self) -> tuple[str, str, str]:
+    def _template_pumpsystem(self) -> Aufgabe:
         """Komplexes Pumpsystem."""
         while True:
-            tank = random.randint(1000, 3000)
-            pumpe_a_zeit = random.randint(20, 40)
-            pumpe_b_zeit = random.randint(30, 60)
-            fuellstand = random.randint(40, 70)
-            if self._register_task(
-                "text/pumpsystem", [tank, pumpe_a_zeit, pumpe_b_zeit, fuellstand]
-            ):
+            werte = self._draw(((1000, 3000), (20, 40), (30, 60), (40, 70)))
+            if self._register_task("text/pumpsystem", werte):
                 break
+        tank, pumpe_a_zeit, pumpe_b_zeit, fuellstand = werte
 
         aufgabe = (
             f"Ein Tank fasst {tank}L. Pumpe A füllt ihn in {pumpe_a_zeit}min, "
@@ -1087,15 +1506,15 @@ class AufgabenGenerator:
             f"Restmenge = {tank}×(1-{fuellstand}/100) = {fmt(restmenge, 1)}L"
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_mischung(self) -> tuple[str, str, str]:
+    def _template_mischung(self) -> Aufgabe:
         """Mischungsaufgabe."""
         while True:
-            sorte_a_preis = random.randint(80, 120) / 100
-            sorte_b_preis = random.randint(150, 200) / 100
-            menge_a = random.randint(20, 40)
-            menge_b = random.randint(10, 30)
+            sorte_a_preis = self._rng.randint(80, 120) / 100
+            sorte_b_preis = self._rng.randint(150, 200) / 100
+            menge_a = self._rng.randint(20, 40)
+            menge_b = self._rng.randint(10, 30)
             zielpreis = (sorte_a_preis + sorte_b_preis) / 2
             x = menge_a * (zielpreis - sorte_a_preis) / (sorte_b_preis - zielpreis)
             if x >= 0 and self._register_task(
@@ -1117,31 +1536,28 @@ class AufgabenGenerator:
         gesamtmenge = menge_a + menge_b
         durchschnitt = gesamtkosten / gesamtmenge
 
-        loesung = (
-            f"a) {fmt(gesamtkosten)}€, b) {fmt(durchschnitt)}€/kg, c) {fmt(x, 1)}kg"
-        )
+        gesamt_s = fmt(gesamtkosten)
+        schnitt_s = fmt(durchschnitt)
+
+        loesung = f"a) {gesamt_s}€, b) {schnitt_s}€/kg, c) {fmt(x, 1)}kg"
         erklaerung = (
-            f"Gesamtkosten = {fmt(kosten_a)} + {fmt(kosten_b)} = {fmt(gesamtkosten)}€. "
-            f"Durchschnitt = {fmt(gesamtkosten)}/{gesamtmenge} = {fmt(durchschnitt)}€/kg"
+            f"Gesamtkosten = {fmt(kosten_a)} + {fmt(kosten_b)} = {gesamt_s}€. "
+            f"Durchschnitt = {gesamt_s}/{gesamtmenge} = {schnitt_s}€/kg"
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_logistik(self) -> tuple[str, str, str]:
+    def _template_logistik(self) -> Aufgabe:
         """Logistikaufgabe."""
         while True:
-            lkw_kapazitaet = random.randint(8000, 12000)
-            paletten = random.randint(20, 30)
-            gewicht_palette = random.randint(200, 400)
-            strecke = random.randint(200, 500)
-            verbrauch = random.randint(25, 35)
-            if self._register_task(
-                "text/logistik",
-                [lkw_kapazitaet, paletten, gewicht_palette, strecke, verbrauch],
-            ):
+            werte = self._draw(
+                ((8000, 12000), (20, 30), (200, 400), (200, 500), (25, 35))
+            )
+            if self._register_task("text/logistik", werte):
                 break
+        lkw_kapazitaet, paletten, gewicht_palette, strecke, verbrauch = werte
 
-        diesel_preis = self.austrian_data.preise["diesel_l"]
+        diesel_preis = self._preise["diesel_l"]
         aufgabe = (
             f"Ein LKW (Nutzlast {lkw_kapazitaet}kg) soll {paletten} Paletten à {gewicht_palette}kg "
             f"über {strecke}km transportieren. Verbrauch: {verbrauch}L/100km, Diesel: {diesel_preis}€/L. "
@@ -1149,7 +1565,7 @@ class AufgabenGenerator:
         )
 
         gesamtgewicht = paletten * gewicht_palette
-        fahrten = math.ceil(gesamtgewicht / lkw_kapazitaet)
+        fahrten = -(-gesamtgewicht // lkw_kapazitaet)  # ganzzahlig aufrunden
 
         diesel_gesamt = fahrten * strecke * verbrauch / 100
         diesel_kosten = diesel_gesamt * diesel_preis
@@ -1161,21 +1577,15 @@ class AufgabenGenerator:
             f"Diesel = {fahrten}×{strecke}×{verbrauch}/100 = {fmt(diesel_gesamt, 1)}L"
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def _template_personalplanung(self) -> tuple[str, str, str]:
+    def _template_personalplanung(self) -> Aufgabe:
         """Personalplanung für ein Projekt."""
         while True:
-            arbeitsstunden = random.randint(400, 800)
-            ziel_tage = random.randint(10, 20)
-            stunden_tag = random.randint(6, 8)
-            arbeiter_vorhanden = random.randint(5, 10)
-            ausfall = random.randint(1, 3)
-            if self._register_task(
-                "text/personal",
-                [arbeitsstunden, ziel_tage, stunden_tag, arbeiter_vorhanden, ausfall],
-            ):
+            werte = self._draw(((400, 800), (10, 20), (6, 8), (5, 10), (1, 3)))
+            if self._register_task("text/personal", werte):
                 break
+        arbeitsstunden, ziel_tage, stunden_tag, arbeiter_vorhanden, ausfall = werte
 
         aufgabe = (
             f"Ein Projekt umfasst {arbeitsstunden} Arbeitsstunden und soll in {ziel_tage} Tagen "
@@ -1184,30 +1594,36 @@ class AufgabenGenerator:
             f"wie viele Tage dauert es? c) Fallen {ausfall} Arbeiter aus, wie lange dauert es dann?"
         )
 
-        arbeiter_noetig = math.ceil(arbeitsstunden / (ziel_tage * stunden_tag))
+        arbeiter_noetig = -(-arbeitsstunden // (ziel_tage * stunden_tag))
+        verbleibend = arbeiter_vorhanden - ausfall
         dauer_b = arbeitsstunden / (arbeiter_vorhanden * stunden_tag)
-        dauer_c = arbeitsstunden / ((arbeiter_vorhanden - ausfall) * stunden_tag)
+        dauer_c = arbeitsstunden / (verbleibend * stunden_tag)
+
+        dauer_b_s = fmt(dauer_b, 1)
+        dauer_c_s = fmt(dauer_c, 1)
 
-        loesung = f"a) {arbeiter_noetig} Arbeiter, b) {fmt(dauer_b, 1)} Tage, c) {fmt(dauer_c, 1)} Tage"
+        loesung = (
+            f"a) {arbeiter_noetig} Arbeiter, b) {dauer_b_s} Tage, c) {dauer_c_s} Tage"
+        )
         erklaerung = (
             f"Tagesleistung pro Arbeiter = {stunden_tag}h. "
             f"Benötigte Arbeiter = {arbeitsstunden}/({ziel_tage}×{stunden_tag}) = {arbeiter_noetig}. "
-            f"Mit {arbeiter_vorhanden} Arbeitern: {arbeitsstunden}/({arbeiter_vorhanden}×{stunden_tag}) = {fmt(dauer_b, 1)} Tage. "
-            f"Nach Ausfall: {arbeitsstunden}/(({arbeiter_vorhanden - ausfall})×{stunden_tag}) = {fmt(dauer_c, 1)} Tage"
+            f"Mit {arbeiter_vorhanden} Arbeitern: {arbeitsstunden}/({arbeiter_vorhanden}×{stunden_tag}) = {dauer_b_s} Tage. "
+            f"Nach Ausfall: {arbeitsstunden}/(({verbleibend})×{stunden_tag}) = {dauer_c_s} Tage"
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def generate_stellenwerttabelle(self) -> tuple[str, str, str]:
+    def generate_stellenwerttabelle(self) -> Aufgabe:
         """Generiert Stellenwerttabellen-Aufgabe."""
         werte = []
         loesungen = []
 
         # 1. Ausgeschriebene Zahl
-        tausender = random.randint(1, 9)
-        hunderter = random.randint(0, 9)
-        zehner = random.randint(0, 9)
-        einer = random.randint(0, 9)
+        tausender = self._rng.randint(1, 9)
+        hunderter = self._rng.randint(0, 9)
+        zehner = self._rng.randint(0, 9)
+        einer = self._rng.randint(0, 9)
 
         zahl = tausender * 1000 + hunderter * 100 + zehner * 10 + einer
         zahl_text = self._zahl_zu_text(zahl)
@@ -1215,19 +1631,17 @@ class AufgabenGenerator:
         loesungen.append(f"{tausender}T {hunderter}H {zehner}Z {einer}E")
 
         # 2. Dezimalzahl
-        dezimal = round(random.uniform(0.001, 9.999), 3)
+        dezimal = round(self._rng.uniform(0.001, 9.999), 3)
         werte.append(fmt(dezimal, 3))
-        # Zerlegung in Stellenwerte
-        ganz = int(dezimal)
-        rest = dezimal - ganz
-        z = int(rest * 10)
-        h = int(rest * 100) % 10
-        t = int(rest * 1000) % 10
+        # Zerlegung in Stellenwerte, ganzzahlig in Tausendsteln (ohne Float-Fehler)
+        ganz, rest = divmod(round(dezimal * 1000), 1000)
+        z, rest = divmod(rest, 100)
+        h, t = divmod(rest, 10)
         loesungen.append(f"{ganz}E {z}z {h}h {t}t")
 
         # 3. Bruch
-        zaehler = random.randint(100, 999)
-        nenner = random.choice([10, 100, 1000])
+        zaehler = self._rng.randint(100, 999)
+        nenner = self._rng.choice((10, 100, 1000))
         werte.append(f"{zaehler}/{nenner}")
         dezimalwert = zaehler / nenner
         loesungen.append(
@@ -1235,318 +1649,166 @@ class AufgabenGenerator:
         )
 
         # 4. Gemischte Darstellung
-        ganz = random.randint(1, 99)
-        dez = random.randint(1, 99)
+        ganz = self._rng.randint(1, 99)
+        dez = self._rng.randint(1, 99)
         werte.append(f"{ganz} und {dez} Hundertstel")
-        loesungen.append(f"{ganz}E {dez // 10}z {dez % 10}h")
+        z, h = divmod(dez, 10)
+        loesungen.append(f"{ganz}E {z}z {h}h")
 
-        aufgabe = "Tragen Sie in die Stellenwerttabelle ein:\n"
-        for i, wert in enumerate(werte, 1):
-            aufgabe += f"{i}. {wert}\n"
+        aufgabe = "Tragen Sie in die Stellenwerttabelle ein:\n" + "".join(
+            f"{i}. {wert}\n" for i, wert in enumerate(werte, 1)
+        )
 
         # Lösung formatieren
-        loesung = "Stellenwerttabelle:\n"
-        loesung += "| Nr | HT | ZT | T | H | Z | E | , | z | h | t |\n"
-        loesung += "|----|----|----|----|----|----|----|----|----|----|----|\n"
+        zeilen = [_STELLENWERT_KOPF]
         for i, tags in enumerate(loesungen, 1):
-            cols = {k: "" for k in ["HT", "ZT", "T", "H", "Z", "E", "z", "h", "t"]}
+            cols = dict.fromkeys(_STELLENWERT_SPALTEN, "")
             for token in tags.split():
                 num = "".join(ch for ch in token if ch.isdigit())
                 sym = "".join(ch for ch in token if ch.isalpha())
                 if sym in cols:
                     cols[sym] = num
-            loesung += (
+            zeilen.append(
                 f"| {i}. | {cols['HT']} | {cols['ZT']} | {cols['T']} | {cols['H']} | "
                 f"{cols['Z']} | {cols['E']} |   | {cols['z']} | {cols['h']} | {cols['t']} |\n"
             )
+        loesung = "".join(zeilen)
 
         erklaerung = "HT=Hunderttausender, ZT=Zehntausender, T=Tausender, H=Hunderter, Z=Zehner, E=Einer, z=Zehntel, h=Hundertstel, t=Tausendstel"
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
     def _zahl_zu_text(self, zahl: int) -> str:
         """Wandelt Zahl in ausgeschriebenen Text."""
-        einer_namen = [
-            "",
-            "ein",
-            "zwei",
-            "drei",
-            "vier",
-            "fünf",
-            "sechs",
-            "sieben",
-            "acht",
-            "neun",
-        ]
-        zehner_namen = [
-            "",
-            "zehn",
-            "zwanzig",
-            "dreißig",
-            "vierzig",
-            "fünfzig",
-            "sechzig",
-            "siebzig",
-            "achtzig",
-            "neunzig",
-        ]
-        spezial = {
-            11: "elf",
-            12: "zwölf",
-            13: "dreizehn",
-            14: "vierzehn",
-            15: "fünfzehn",
-            16: "sechzehn",
-            17: "siebzehn",
-            18: "achtzehn",
-            19: "neunzehn",
-        }
-
-        if zahl == 0:
-            return "null"
-        elif zahl < 10:
-            return einer_namen[zahl] if zahl != 1 else "eins"
-        elif 11 <= zahl <= 19:
-            return spezial[zahl]
-        elif zahl < 100:
-            z = zahl // 10
-            e = zahl % 10
-            if e == 0:
-                return zehner_namen[z]
-            elif e == 1:
-                return "einund" + zehner_namen[z]
-            else:
-                return einer_namen[e] + "und" + zehner_namen[z]
-        elif zahl < 1000:
-            h = zahl // 100
-            rest = zahl % 100
-            result = einer_namen[h] + "hundert"
-            if rest > 0:
-                result += self._zahl_zu_text(rest)
-            return result
-        elif zahl < 10000:
-            t = zahl // 1000
-            rest = zahl % 1000
-            if t == 1:
-                result = "eintausend"
-            else:
-                result = einer_namen[t] + "tausend"
-            if rest > 0:
-                result += self._zahl_zu_text(rest)
-            return result
-        else:
-            # Für größere Zahlen
-            return str(zahl)
+        return _zahl_text(zahl)
 
-    def generate_drei_ansichten(self) -> tuple[str, str, str]:
+    def generate_drei_ansichten(self) -> Aufgabe:
         """Generiert Drei-Ansichten-Aufgabe."""
-        koerper_ascii = {
-            "Quader mit Aussparung": (
-                "```\n" "┌───────┐\n" "│ ┌───┐ │\n" "│ └───┘ │\n" "└───────┘\n" "```"
-            ),
-            "L-förmiger Körper": (
-                "```\n"
-                "    ┌───┐\n"
-                "    │   │\n"
-                "┌───┼───┘\n"
-                "│   │\n"
-                "└───┘\n"
-                "```"
-            ),
-            "T-förmiger Körper": (
-                "```\n"
-                "┌───┬───┬───┐\n"
-                "│   │   │   │\n"
-                "└───┼───┼───┘\n"
-                "    │   │\n"
-                "    └───┘\n"
-                "```"
-            ),
-            "Treppenförmiger Körper": (
-                "```\n" "┌───┐\n" "│   └───┐\n" "│       │\n" "└───────┘\n" "```"
-            ),
-            "Würfel mit quadratischer Bohrung": (
-                "```\n" "┌───┐\n" "│┌─┐│\n" "│└─┘│\n" "└───┘\n" "```"
-            ),
-            "U-förmiger Körper": (
-                "```\n"
-                "┌───┐ ┌───┐\n"
-                "│   │ │   │\n"
-                "└───┼─┼───┘\n"
-                "    │ │\n"
-                "    └─┘\n"
-                "```"
-            ),
-            "Z-förmiger Körper": (
-                "```\n" "┌───┐\n" "└─┐ │\n" "  │ └─┐\n" "  └───┘\n" "```"
-            ),
-        }
-
-        koerper = random.choice(list(koerper_ascii.keys()))
+        koerper = self._rng.choice(_KOERPER_ASCII_KEYS)
 
         aufgabe = (
             f"Skizzieren Sie den {koerper} in Vorderansicht, Seitenansicht (von links) und Draufsicht.\n"
             "Ordnen Sie die Ansichten nach technischer Norm an.\n"
-            "(Verwenden Sie einen weichen Bleistift, Lineal ist nicht notwendig)"
+            "(Verwenden Sie einen weichen Bleistift, Lineal ist nicht notwendig)\n"
+            f"{_KOERPER_ASCII.get(koerper, '')}"
         )
 
-        aufgabe += "\n" + koerper_ascii.get(koerper, "")
-
         loesung = f"Drei Ansichten des {koerper} nach DIN/ISO"
         erklaerung = (
             "Anordnung nach 1. Winkelprojektion (DIN/ISO): Draufsicht über der Vorderansicht, "
             "Seitenansicht (linke Ansicht) links der Vorderansicht; gleiche Maßstäbe beachten."
         )
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def generate_koerpernetz(self) -> tuple[str, str, str]:
+    def generate_koerpernetz(self) -> Aufgabe:
         """Generiert Körpernetz-Aufgabe."""
-        koerper_typen = {
-            "Würfel": 6,
-            "Quader": 6,
-            "Pyramide (quadratische Grundfläche)": 5,
-            "Prisma (dreieckige Grundfläche)": 5,
-            "Tetraeder": 4,
-        }
-
-        netz_ascii = {
-            "Würfel": (
-                "```\n"
-                "    ┌───┐\n"
-                "┌───┼───┼───┐\n"
-                "└───┼───┼───┘\n"
-                "    └───┘\n"
-                "```"
-            ),
-            "Quader": (
-                "```\n"
-                "    ┌─────┐\n"
-                "┌─────┼─────┼─────┐\n"
-                "└─────┼─────┼─────┘\n"
-                "    └─────┘\n"
-                "```"
-            ),
-            "Pyramide (quadratische Grundfläche)": (
-                "```\n" "  ▲\n" " ▲▲▲\n" "▲▲▲▲▲\n" "  ◼\n" "```"
-            ),
-        }
-
-        koerper = random.choice(list(koerper_typen.keys()))
-        flaechen = koerper_typen[koerper]
-
-        aufgabe = f"Skizzieren Sie das Körpernetz eines {koerper}.\n"
-        aufgabe += f"Beachten Sie: Der Körper hat {flaechen} Flächen."
+        koerper = self._rng.choice(_KOERPER_FLAECHEN_KEYS)
+        flaechen = _KOERPER_FLAECHEN[koerper]
 
-        if koerper in netz_ascii:
-            aufgabe += "\n" + netz_ascii[koerper]
+        netz = f"\n{_NETZ_ASCII[koerper]}" if koerper in _NETZ_ASCII else ""
+        aufgabe = (
+            f"Skizzieren Sie das Körpernetz eines {koerper}.\n"
+            f"Beachten Sie: Der Körper hat {flaechen} Flächen.{netz}"
+        )
 
         loesung = f"Körpernetz des {koerper} mit {flaechen} Flächen"
         erklaerung = "Alle Flächen müssen zusammenhängend und ausklappbar sein"
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def generate_runden(self) -> tuple[str, str, str]:
+    def generate_runden(self) -> Aufgabe:
         """Generiert Rundungsaufgabe."""
-        zahlen = []
-        stellen = []
-        gerundete = []
+        rng = self._rng
+        round_to_place = self.math_solver.round_to_place
+        aufgabe_teile = ["Runden Sie auf die angegebene Stelle:\n"]
+        loesung_teile = []
 
-        for _ in range(4):
+        # Ziehen, Runden und Formatieren in einem Durchlauf
+        for i in range(1, 5):
             # Verschiedene Zahlentypen
-            if random.random() < 0.5:
+            if rng.random() < 0.5:
                 # Dezimalzahl
-                zahl = round(random.uniform(0.001, 9999.999), 4)
-                stelle = random.choice(["E", "z", "h", "t"])
+                zahl = round(rng.uniform(0.001, 9999.999), 4)
+                stelle = rng.choice(("E", "z", "h", "t"))
             else:
                 # Große Zahl
-                zahl = random.randint(10000, 999999) + random.random()
-                stelle = random.choice(["Z", "H", "T", "ZT", "HT"])
-
-            zahlen.append(zahl)
-            stellen.append(stelle)
+                zahl = rng.randint(10000, 999999) + rng.random()
+                stelle = rng.choice(("Z", "H", "T", "ZT", "HT"))
 
             # Runden
-            gerundet_wert = self.math_solver.round_to_place(zahl, stelle)
-            gerundete.append(gerundet_wert)
+            gerundet = round_to_place(zahl, stelle)
 
-        aufgabe = "Runden Sie auf die angegebene Stelle:\n"
-        loesung = ""
-
-        for i, (zahl, stelle, gerundet) in enumerate(
-            zip(zahlen, stellen, gerundete), 1
-        ):
             # Formatierung der Zahl je nach Größe
             if zahl >= 1000:
                 zahl_str = fmt(zahl, 2)
             else:
                 zahl_str = fmt(zahl, 4)
 
-            aufgabe += f"{i}. {zahl_str} (≈{stelle}) = _____\n"
+            aufgabe_teile.append(f"{i}. {zahl_str} (≈{stelle}) = _____\n")
 
-            if isinstance(gerundet, int) or float(gerundet).is_integer():
-                loesung += f"{i}. {fmt(gerundet)}\n"
+            if gerundet.is_integer():
+                loesung_teile.append(f"{i}. {fmt(gerundet)}\n")
             elif gerundet >= 1000:
-                loesung += f"{i}. {fmt(gerundet, 0)}\n"
+                loesung_teile.append(f"{i}. {fmt(gerundet, 0)}\n")
             else:
-                loesung += f"{i}. {fmt(gerundet, 4)}".rstrip("0").rstrip(",") + "\n"
+                loesung_teile.append(f"{i}. {fmt_trim(gerundet)}\n")
+
+        aufgabe = "".join(aufgabe_teile)
+        loesung = "".join(loesung_teile)
 
         erklaerung = "E=Einer, z=Zehntel, h=Hundertstel, t=Tausendstel, Z=Zehner, H=Hunderter, T=Tausender, ZT=Zehntausender, HT=Hunderttausender"
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def generate_einheiten(self, niveau: int) -> tuple[str, str, str]:
+    def generate_einheiten(self, niveau: int) -> Aufgabe:
         """Generiert Einheitenumwandlung."""
         if niveau == 1:  # Leicht
             conversions = [
-                (random.randint(3, 20), "m", "cm"),
-                (random.randint(2, 15), "kg", "g"),
-                (random.randint(1, 10), "l", "ml"),
+                (self._rng.randint(3, 20), "m", "cm"),
+                (self._rng.randint(2, 15), "kg", "g"),
+                (self._rng.randint(1, 10), "l", "ml"),
             ]
         elif niveau == 2:  # Mittel
             conversions = [
-                (random.randint(2, 10), "m²", "cm²"),
-                (random.randint(5, 30), "dm³", "l"),
-                (random.randint(100, 500), "cm", "dm"),
+                (self._rng.randint(2, 10), "m²", "cm²"),
+                (self._rng.randint(5, 30), "dm³", "l"),
+                (self._rng.randint(100, 500), "cm", "dm"),
             ]
         else:  # Schwer
             conversions = [
-                (random.randint(500000, 2000000), "cm³", "m³"),
-                (random.randint(180, 420), "min", "h"),
-                (random.uniform(0.1, 9.9), "km²", "ha"),
+                (self._rng.randint(500000, 2000000), "cm³", "m³"),
+                (self._rng.randint(180, 420), "min", "h"),
+                (self._rng.uniform(0.1, 9.9), "km²", "ha"),
             ]
 
-        aufgabe = ""
-        loesung = ""
+        aufgabe_teile = []
+        loesung_teile = []
 
         for i, (wert, von, nach) in enumerate(conversions, 1):
-            aufgabe += f"{i}. {wert} {von} = _____ {nach}\n"
+            aufgabe_teile.append(f"{i}. {wert} {von} = _____ {nach}\n")
             ergebnis = self.converter.convert(wert, von, nach)
 
             if ergebnis is not None:
-                if ergebnis >= 10000:
-                    loesung += f"{i}. {de_format(ergebnis, 0)} {nach}\n"
-                elif ergebnis >= 1:
-                    loesung += f"{i}. {de_format(ergebnis, 2)} {nach}\n"
-                elif ergebnis >= 0.01:
-                    loesung += f"{i}. {de_format(ergebnis, 4)} {nach}\n"
-                else:
-                    loesung += f"{i}. {de_format(ergebnis, 6)} {nach}\n"
+                nd = _EINHEIT_NACHKOMMA[bisect_right(_EINHEIT_SCHWELLEN, ergebnis)]
+                loesung_teile.append(f"{i}. {de_format(ergebnis, nd)} {nach}\n")
             else:
-                loesung += f"{i}. [Konvertierung nicht möglich]\n"
+                loesung_teile.append(f"{i}. [Konvertierung nicht möglich]\n")
 
+        aufgabe = "".join(aufgabe_teile)
+        loesung = "".join(loesung_teile)
         erklaerung = "Verwenden Sie die korrekten Umrechnungsfaktoren"
 
-        return aufgabe, loesung, erklaerung
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def generate_geometrie(self, zeichnen: bool = True) -> tuple[str, str, str]:
+    def generate_geometrie(self, zeichnen: bool = True) -> Aufgabe:
         """Generiert Geometrieaufgabe."""
         if zeichnen:
             # L-förmiges Werkstück
-            l1 = random.randint(40, 80)
-            w1 = random.randint(30, 60)
-            l2 = random.randint(20, 40)
-            w2 = random.randint(15, 35)
+            l1 = self._rng.randint(40, 80)
+            w1 = self._rng.randint(30, 60)
+            l2 = self._rng.randint(20, 40)
+            w2 = self._rng.randint(15, 35)
             mass_num, mass_den = self._choose_scale(l1, w1, l2, w2)
             massstab = f"{mass_num}:{mass_den}"
 
@@ -1566,16 +1828,14 @@ class AufgabenGenerator:
 
         else:
             # Volumenberechnung
-            laenge = random.randint(300, 600)
-            breite = random.randint(15, 35)
-            hoehe = random.randint(8, 20)
-            material = random.choice(["stahl", "aluminium"])
-            dichte = self.austrian_data.materialien[material]["dichte"]
-            preis = self.austrian_data.preise[f"{material}_kg"]
-            verschnitt = random.randint(8, 15)
+            laenge = self._rng.randint(300, 600)
+            breite = self._rng.randint(15, 35)
+            hoehe = self._rng.randint(8, 20)
+            material, dichte, preis = self._rng.choice(self._traeger)
+            verschnitt = self._rng.randint(8, 15)
 
             aufgabe = (
-                f"Ein {material.title()}träger: {laenge}cm × {breite}cm × {hoehe}cm\n"
+                f"Ein {material}träger: {laenge}cm × {breite}cm × {hoehe}cm\n"
                 f"Dichte: {dichte}kg/dm³, Preis: {preis}€/kg\n"
                 f"a) Gewicht? b) Materialkosten? c) Mit {verschnitt}% Verschnitt?"
             )
@@ -1587,38 +1847,18 @@ class AufgabenGenerator:
             kosten = gewicht * preis
             kosten_verschnitt = kosten * (1 + verschnitt / 100)
 
+            gewicht_s = fmt(gewicht)
             loesung = (
-                f"a) {fmt(gewicht)}kg, b) {fmt(kosten)}€, c) {fmt(kosten_verschnitt)}€"
+                f"a) {gewicht_s}kg, b) {fmt(kosten)}€, c) {fmt(kosten_verschnitt)}€"
             )
             volumen_m3 = volumen / 1000
-            erklaerung = f"Volumen: {fmt(volumen)}dm³ ({fmt(volumen_m3, 3)}m³), Gewicht: {fmt(gewicht)}kg"
-
-        return aufgabe, loesung, erklaerung
-
+            erklaerung = f"Volumen: {fmt(volumen)}dm³ ({fmt(volumen_m3, 3)}m³), Gewicht: {gewicht_s}kg"
 
-class TestGenerator:
-    """Hauptklasse für Testgenerierung."""
+        return Aufgabe(aufgabe, loesung, erklaerung)
 
-    def __init__(
-        self,
-        schwierigkeit: Schwierigkeit = Schwierigkeit.MITTEL,
-        seed: int | None = None,
-        var_symbol: str = "x",
-    ):
-        if seed is not None:
-            random.seed(seed)
-        self.schwierigkeit = schwierigkeit
-        self.generator = AufgabenGenerator(schwierigkeit)
-        self.test_content = ""
-        self.solutions = ""
-        self.detailed_solutions = []
-        self.var_symbol = var_symbol
 
-    def generate_complete_test(self) -> tuple[str, str, list[dict]]:
-        """Generiert kompletten Test mit exakt 100 Punkten."""
-
-        # Header
-        self.test_content = """# Überstiegstest - Technische Basisausbildung
+# Feste Kopfblöcke von Test und Lösungen
+_KOPF_TEST_MD = """# Überstiegstest - Technische Basisausbildung
 
 **Name: ________________________________    Datum: ________________**
 
@@ -1629,8 +1869,7 @@ class TestGenerator:
 ---
 
 """
-
-        self.solutions = """# LÖSUNGEN - Überstiegstest
+_KOPF_LOESUNG_MD = """# LÖSUNGEN - Überstiegstest
 
 **Lösungsschlüssel für Lehrkraft**
 
@@ -1638,6 +1877,86 @@ class TestGenerator:
 
 """
 
+# Feste Schlussblöcke von Test (Notenschlüssel) und Lösungen (Punkteverteilung)
+_BEWERTUNG_MD = """
+---
+
+## Bewertungsschlüssel
+
+| Note | Bezeichnung | Punkte | Prozent |
+|------|------------|--------|---------|
+| 1 | Sehr gut | 90-100 | 90-100% |
+| 2 | Gut | 80-89 | 80-89% |
+| 3 | Befriedigend | 70-79 | 70-79% |
+| 4 | Genügend | 60-69 | 60-69% |
+| 5 | Nicht genügend | 0-59 | 0-59% |
+
+**Viel Erfolg!**
+"""
+_PUNKTEVERTEILUNG_MD = (
+    "\n## Punkteverteilung\n\n"
+    "- Grundrechenarten: 20 Punkte (2+2+3+3+5+5)\n"
+    "- Zahlenraum: 20 Punkte (5+5+3+7)\n"
+    "- Textaufgaben: 20 Punkte (10+10)\n"
+    "- Brüche/Gleichungen: 20 Punkte (12+8)\n"
+    "- Raumvorstellung: 20 Punkte (5+5+5+5)\n"
+    "\n**Gesamt: 100 Punkte**\n"
+)
+
+# Aufgabe 2a ist ohne Zufallswerte und daher fester Text
+_ZAHLENSTRAHL_AUFGABE = (
+    "**a) Zahlenstrahl (5 Punkte)**\n"
+    "Tragen Sie folgende Werte ein: 0,5; -2,8; 6; 1/2; -3/4\n\n"
+    "```\n"
+    "-10 _____|_____|_____|_____|_____|_____|_____|_____|_____|_____|_____ +10\n"
+    "```\n\n"
+)
+
+
+class TestGenerator:
+    """Hauptklasse für Testgenerierung."""
+
+    __slots__ = (
+        "schwierigkeit",
+        "generator",
+        "_test_parts",
+        "_sol_parts",
+        "detailed_solutions",
+        "var_symbol",
+    )
+
+    # Je zwei leichte (2 Punkte), mittlere (3 Punkte) und schwere (5 Punkte)
+    _GRUNDRECHNUNG_GRUPPEN = (("a", 2), ("b", 3), ("c", 5))
+
+    def __init__(
+        self,
+        schwierigkeit: Schwierigkeit = Schwierigkeit.MITTEL,
+        seed: int | None = None,
+        var_symbol: str = "x",
+    ):
+        self.schwierigkeit = schwierigkeit
+        self.generator = AufgabenGenerator(schwierigkeit, seed=seed)
+        # Textbausteine von Test und Lösungen, erst am Ende zusammengefügt
+        self._test_parts: list[str] = []
+        self._sol_parts: list[str] = []
+        self.detailed_solutions: list[AufgabenLoesung] = []
+        self.var_symbol = var_symbol
+
+    @property
+    def test_content(self) -> str:
+        return "".join(self._test_parts)
+
+    @property
+    def solutions(self) -> str:
+        return "".join(self._sol_parts)
+
+    def generate_complete_test(self) -> tuple[str, str, list[AufgabenLoesung]]:
+        """Generiert kompletten Test mit exakt 100 Punkten."""
+
+        # Header
+        self._test_parts = [_KOPF_TEST_MD]
+        self._sol_parts = [_KOPF_LOESUNG_MD]
+
         # 1. GRUNDRECHENARTEN (20 Punkte)
         self._add_grundrechenarten()
 
@@ -1660,324 +1979,309 @@ class TestGenerator:
 
     def _add_grundrechenarten(self):
         """Fügt Grundrechenarten-Sektion hinzu."""
-        self.test_content += "## 1. Grundrechenarten (20 Punkte)\n"
-        self.test_content += "*Beachten Sie: Klammer vor Punkt vor Strich! Runden Sie auf 2 Dezimalstellen.*\n\n"
-
-        self.solutions += "## 1. Grundrechenarten\n\n"
-
-        # 2 leichte (je 2 Punkte)
-        for i, punkte in enumerate([2, 2], start=1):
-            aufgabe, loesung, erklaerung = self.generator.generate_grundrechnung(punkte)
-            self.test_content += f"**a.{i})** {aufgabe} = _____ **(2 Punkte)**\n\n"
-            self.solutions += f"**a.{i})** {aufgabe} = **{loesung}**\n"
-            self.solutions += f"   {erklaerung}\n\n"
-            self.detailed_solutions.append(
-                {
-                    "nummer": f"1.a.{i}",
-                    "aufgabe": aufgabe,
-                    "loesung": loesung,
-                    "erklaerung": erklaerung,
-                    "punkte": punkte,
-                }
-            )
+        test = self._test_parts
+        sol = self._sol_parts
+        test.append("## 1. Grundrechenarten (20 Punkte)\n")
+        test.append(
+            "*Beachten Sie: Klammer vor Punkt vor Strich! Runden Sie auf 2 Dezimalstellen.*\n\n"
+        )
+        sol.append("## 1. Grundrechenarten\n\n")
+        generate = self.generator.generate_grundrechnung
+        details = self.detailed_solutions
+
+        for gruppe, punkte in self._GRUNDRECHNUNG_GRUPPEN:
+            for i in (1, 2):
+                aufgabe, loesung, erklaerung = generate(punkte)
+                nr = f"{gruppe}.{i}"
+                test.append(f"**{nr})** {aufgabe} = _____ **({punkte} Punkte)**\n\n")
+                sol.append(f"**{nr})** {aufgabe} = **{loesung}**\n   {erklaerung}\n\n")
+                details.append(
+                    AufgabenLoesung(f"1.{nr}", aufgabe, loesung, erklaerung, punkte)
+                )
 
-        # 2 mittlere (je 3 Punkte)
-        for i, punkte in enumerate([3, 3], start=1):
-            aufgabe, loesung, erklaerung = self.generator.generate_grundrechnung(punkte)
-            self.test_content += f"**b.{i})** {aufgabe} = _____ **(3 Punkte)**\n\n"
-            self.solutions += f"**b.{i})** {aufgabe} = **{loesung}**\n"
-            self.solutions += f"   {erklaerung}\n\n"
-            self.detailed_solutions.append(
-                {
-                    "nummer": f"1.b.{i}",
-                    "aufgabe": aufgabe,
-                    "loesung": loesung,
-                    "erklaerung": erklaerung,
-                    "punkte": punkte,
-                }
-            )
+        test.append("\n---\n\n")
 
-        # 2 schwere (je 5 Punkte)
-        for i, punkte in enumerate([5, 5], start=1):
-            aufgabe, loesung, erklaerung = self.generator.generate_grundrechnung(punkte)
-            self.test_content += f"**c.{i})** {aufgabe} = _____ **(5 Punkte)**\n\n"
-            self.solutions += f"**c.{i})** {aufgabe} = **{loesung}**\n"
-            self.solutions += f"   {erklaerung}\n\n"
-            self.detailed_solutions.append(
-                {
-                    "nummer": f"1.c.{i}",
-                    "aufgabe": aufgabe,
-                    "loesung": loesung,
-                    "erklaerung": erklaerung,
-                    "punkte": punkte,
-                }
+    def _add_aufgabe(
+        self,
+        nummer: str,
+        titel: str,
+        punkte: int,
+        aufgabe: Aufgabe,
+        mit_erklaerung: bool = True,
+    ):
+        """Hängt eine Aufgabe mit fetter Kopfzeile an Test, Lösungen und Details an."""
+        label = nummer.split(".", 1)[1]
+        kopf = f"{titel} ({punkte} Punkte)" if titel else f"({punkte} Punkte)"
+        self._test_parts.append(f"**{label}) {kopf}**\n{aufgabe.aufgabe}\n\n")
+        if mit_erklaerung:
+            self._sol_parts.append(
+                f"**{label})** {aufgabe.loesung}\n   {aufgabe.erklaerung}\n\n"
             )
+        else:
+            self._sol_parts.append(f"**{label})** {aufgabe.loesung}\n\n")
+        self._add_detail(nummer, aufgabe, punkte)
 
-        self.test_content += "\n---\n\n"
+    def _add_detail(self, nummer: str, aufgabe: Aufgabe, punkte: int):
+        """Registriert die detaillierte Lösung einer Aufgabe."""
+        self.detailed_solutions.append(AufgabenLoesung(nummer, *aufgabe, punkte))
 
     def _add_zahlenraum(self):
         """Fügt Zahlenraum-Sektion hinzu."""
-        self.test_content += "## 2. Zahlenraum (20 Punkte)\n\n"
-        self.solutions += "## 2. Zahlenraum\n\n"
+        gen = self.generator
+        test = self._test_parts
+        sol = self._sol_parts
+        test.append("## 2. Zahlenraum (20 Punkte)\n\n")
+        sol.append("## 2. Zahlenraum\n\n")
 
         # Zahlenstrahl (5 Punkte)
-        self.test_content += "**a) Zahlenstrahl (5 Punkte)**\n"
-        self.test_content += (
-            "Tragen Sie folgende Werte ein: 0,5; -2,8; 6; 1/2; -3/4\n\n"
-        )
-        self.test_content += "```\n"
-        self.test_content += "-10 _____|_____|_____|_____|_____|_____|_____|_____|_____|_____|_____ +10\n"
-        self.test_content += "```\n\n"
-        self.solutions += "**a)** Zahlenstrahl mit eingetragenen Werten\n\n"
-
-        # Stellenwerttabelle (5 Punkte)
-        aufgabe, loesung, erklaerung = self.generator.generate_stellenwerttabelle()
-        self.test_content += f"**b) Stellenwerttabelle (5 Punkte)**\n{aufgabe}\n\n"
-        self.solutions += f"**b)** {loesung}\n\n"
-        self.detailed_solutions.append(
-            {
-                "nummer": "2.b",
-                "aufgabe": aufgabe,
-                "loesung": loesung,
-                "erklaerung": erklaerung,
-                "punkte": 5,
-            }
+        test.append(_ZAHLENSTRAHL_AUFGABE)
+        sol.append("**a)** Zahlenstrahl mit eingetragenen Werten\n\n")
+
+        # Stellenwerttabelle (5 Punkte) und Runden (3 Punkte)
+        self._add_aufgabe(
+            "2.b",
+            "Stellenwerttabelle",
+            5,
+            gen.generate_stellenwerttabelle(),
+            mit_erklaerung=False,
         )
-
-        # Runden (3 Punkte)
-        aufgabe, loesung, erklaerung = self.generator.generate_runden()
-        self.test_content += f"**c) Runden (3 Punkte)**\n{aufgabe}\n\n"
-        self.solutions += f"**c)** {loesung}\n\n"
-        self.detailed_solutions.append(
-            {
-                "nummer": "2.c",
-                "aufgabe": aufgabe,
-                "loesung": loesung,
-                "erklaerung": erklaerung,
-                "punkte": 3,
-            }
+        self._add_aufgabe(
+            "2.c", "Runden", 3, gen.generate_runden(), mit_erklaerung=False
         )
 
         # Einheiten (7 Punkte: 2+2+3)
-        self.test_content += "**d) Einheitenumwandlungen (7 Punkte)**\n\n"
-
-        for niveau, punkte, titel in [
+        test.append("**d) Einheitenumwandlungen (7 Punkte)**\n\n")
+        for niveau, punkte, titel in (
             (1, 2, "Leicht"),
             (2, 2, "Mittel"),
             (3, 3, "Schwer"),
-        ]:
-            aufgabe, loesung, erklaerung = self.generator.generate_einheiten(niveau)
-            self.test_content += f"*{titel} ({punkte} Punkte):*\n{aufgabe}\n"
-            self.solutions += f"**d.{niveau})** {loesung}\n"
-            self.detailed_solutions.append(
-                {
-                    "nummer": f"2.d.{niveau}",
-                    "aufgabe": aufgabe,
-                    "loesung": loesung,
-                    "erklaerung": erklaerung,
-                    "punkte": punkte,
-                }
-            )
+        ):
+            aufgabe = gen.generate_einheiten(niveau)
+            test.append(f"*{titel} ({punkte} Punkte):*\n{aufgabe.aufgabe}\n")
+            sol.append(f"**d.{niveau})** {aufgabe.loesung}\n")
+            self._add_detail(f"2.d.{niveau}", aufgabe, punkte)
 
-        self.test_content += "\n---\n\n"
+        test.append("\n---\n\n")
 
     def _add_textaufgaben(self):
         """Fügt Textaufgaben-Sektion hinzu."""
-        self.test_content += "## 3. Textaufgaben (20 Punkte)\n\n"
-        self.solutions += "## 3. Textaufgaben\n\n"
-
-        # Mittlere Aufgabe (10 Punkte)
-        aufgabe, loesung, erklaerung = self.generator.generate_textaufgabe(10)
-        self.test_content += f"**a) (10 Punkte)**\n{aufgabe}\n\n"
-        self.solutions += f"**a)** {loesung}\n   {erklaerung}\n\n"
-        self.detailed_solutions.append(
-            {
-                "nummer": "3.a",
-                "aufgabe": aufgabe,
-                "loesung": loesung,
-                "erklaerung": erklaerung,
-                "punkte": 10,
-            }
-        )
+        self._test_parts.append("## 3. Textaufgaben (20 Punkte)\n\n")
+        self._sol_parts.append("## 3. Textaufgaben\n\n")
 
-        # Schwere Aufgabe (10 Punkte)
-        aufgabe, loesung, erklaerung = self.generator.generate_textaufgabe(15)
-        self.test_content += f"**b) (10 Punkte)**\n{aufgabe}\n\n"
-        self.solutions += f"**b)** {loesung}\n   {erklaerung}\n\n"
-        self.detailed_solutions.append(
-            {
-                "nummer": "3.b",
-                "aufgabe": aufgabe,
-                "loesung": loesung,
-                "erklaerung": erklaerung,
-                "punkte": 10,
-            }
-        )
+        # Mittlere und schwere Aufgabe (je 10 Punkte)
+        for nummer, stufe in (("3.a", 10), ("3.b", 15)):
+            self._add_aufgabe(
+                nummer, "", 10, self.generator.generate_textaufgabe(stufe)
+            )
 
-        self.test_content += "\n---\n\n"
+        self._test_parts.append("\n---\n\n")
 
     def _add_brueche_gleichungen(self):
         """Fügt Brüche und Gleichungen hinzu."""
-        self.test_content += "## 4. Brüche und Gleichungen (20 Punkte)\n\n"
-        self.solutions += "## 4. Brüche und Gleichungen\n\n"
+        gen = self.generator
+        test = self._test_parts
+        sol = self._sol_parts
+        test.append("## 4. Brüche und Gleichungen (20 Punkte)\n\n")
+        sol.append("## 4. Brüche und Gleichungen\n\n")
 
         # 3 Bruchrechnungen (je 4 Punkte = 12 Punkte)
-        self.test_content += (
-            "**Bruchrechnung (12 Punkte)**\n*Kürzen Sie vollständig!*\n\n"
-        )
-
-        for i in range(3):
-            aufgabe, loesung, erklaerung = self.generator.generate_bruchaufgabe(4)
-            self.test_content += f"**a.{i + 1})** {aufgabe} = _____ **(4 Punkte)**\n\n"
-            self.solutions += (
-                f"**a.{i + 1})** {aufgabe} = **{loesung}**\n   {erklaerung}\n\n"
-            )
+        test.append("**Bruchrechnung (12 Punkte)**\n*Kürzen Sie vollständig!*\n\n")
+        for i in (1, 2, 3):
+            aufgabe, loesung, erklaerung = gen.generate_bruchaufgabe(4)
+            kopf = f"**a.{i})** {aufgabe} = "
+            test.append(f"{kopf}_____ **(4 Punkte)**\n\n")
+            sol.append(f"{kopf}**{loesung}**\n   {erklaerung}\n\n")
             self.detailed_solutions.append(
-                {
-                    "nummer": f"4.a.{i + 1}",
-                    "aufgabe": aufgabe,
-                    "loesung": loesung,
-                    "erklaerung": erklaerung,
-                    "punkte": 4,
-                }
+                AufgabenLoesung(f"4.a.{i}", aufgabe, loesung, erklaerung, 4)
             )
 
-        # 2 Gleichungen (je 4 Punkte = 8 Punkte)
-        self.test_content += "**Gleichungen (8 Punkte)**\n\n"
-
-        # Mittlere Gleichung
-        aufgabe, loesung, erklaerung = self.generator.generate_gleichung(
-            schwer=False, var=self.var_symbol
-        )
-        self.test_content += f"**b.1)** {aufgabe} **(4 Punkte)**\n\n"
-        self.solutions += f"**b.1)** {loesung}\n   {erklaerung}\n\n"
-        self.detailed_solutions.append(
-            {
-                "nummer": "4.b.1",
-                "aufgabe": aufgabe,
-                "loesung": loesung,
-                "erklaerung": erklaerung,
-                "punkte": 4,
-            }
-        )
-
-        # Schwere Gleichung
-        aufgabe, loesung, erklaerung = self.generator.generate_gleichung(
-            schwer=True, var=self.var_symbol
-        )
-        self.test_content += f"**b.2)** {aufgabe} **(4 Punkte)**\n\n"
-        self.solutions += f"**b.2)** {loesung}\n   {erklaerung}\n\n"
-        self.detailed_solutions.append(
-            {
-                "nummer": "4.b.2",
-                "aufgabe": aufgabe,
-                "loesung": loesung,
-                "erklaerung": erklaerung,
-                "punkte": 4,
-            }
-        )
+        # 2 Gleichungen (je 4 Punkte = 8 Punkte): mittel, dann schwer
+        test.append("**Gleichungen (8 Punkte)**\n\n")
+        for i, schwer in ((1, False), (2, True)):
+            aufgabe = gen.generate_gleichung(schwer=schwer, var=self.var_symbol)
+            kopf = f"**b.{i})** "
+            test.append(f"{kopf}{aufgabe.aufgabe} **(4 Punkte)**\n\n")
+            sol.append(f"{kopf}{aufgabe.loesung}\n   {aufgabe.erklaerung}\n\n")
+            self._add_detail(f"4.b.{i}", aufgabe, 4)
 
-        self.test_content += "\n---\n\n"
+        test.append("\n---\n\n")
 
     def _add_raumvorstellung(self):
         """Fügt Raumvorstellung-Sektion hinzu."""
-        self.test_content += "## 5. Raumvorstellung (20 Punkte)\n\n"
-        self.solutions += "## 5. Raumvorstellung\n\n"
-
-        # Drei-Ansichten (5 Punkte)
-        aufgabe, loesung, erklaerung = self.generator.generate_drei_ansichten()
-        self.test_content += f"**a) Drei Ansichten (5 Punkte)**\n{aufgabe}\n\n"
-        self.solutions += f"**a)** {loesung}\n   {erklaerung}\n\n"
-        self.detailed_solutions.append(
-            {
-                "nummer": "5.a",
-                "aufgabe": aufgabe,
-                "loesung": loesung,
-                "erklaerung": erklaerung,
-                "punkte": 5,
-            }
-        )
+        gen = self.generator
+        self._test_parts.append("## 5. Raumvorstellung (20 Punkte)\n\n")
+        self._sol_parts.append("## 5. Raumvorstellung\n\n")
+
+        # Vier Aufgaben zu je 5 Punkten
+        for nummer, titel, erzeugen in (
+            ("5.a", "Drei Ansichten", gen.generate_drei_ansichten),
+            ("5.b", "Körpernetz", gen.generate_koerpernetz),
+            (
+                "5.c",
+                "Geometrische Berechnung und Zeichnung",
+                functools.partial(gen.generate_geometrie, zeichnen=True),
+            ),
+            (
+                "5.d",
+                "Volumen und Gewicht",
+                functools.partial(gen.generate_geometrie, zeichnen=False),
+            ),
+        ):
+            self._add_aufgabe(nummer, titel, 5, erzeugen())
 
-        # Körpernetz (5 Punkte)
-        aufgabe, loesung, erklaerung = self.generator.generate_koerpernetz()
-        self.test_content += f"**b) Körpernetz (5 Punkte)**\n{aufgabe}\n\n"
-        self.solutions += f"**b)** {loesung}\n   {erklaerung}\n\n"
-        self.detailed_solutions.append(
-            {
-                "nummer": "5.b",
-                "aufgabe": aufgabe,
-                "loesung": loesung,
-                "erklaerung": erklaerung,
-                "punkte": 5,
-            }
-        )
+    def _add_bewertung(self):
+        """Fügt Bewertungsschlüssel hinzu."""
+        self._test_parts.append(_BEWERTUNG_MD)
+        self._sol_parts.append(_PUNKTEVERTEILUNG_MD)
 
-        # Geometrie Zeichnung (5 Punkte)
-        aufgabe, loesung, erklaerung = self.generator.generate_geometrie(zeichnen=True)
-        self.test_content += (
-            f"**c) Geometrische Berechnung und Zeichnung (5 Punkte)**\n{aufgabe}\n\n"
-        )
-        self.solutions += f"**c)** {loesung}\n   {erklaerung}\n\n"
-        self.detailed_solutions.append(
-            {
-                "nummer": "5.c",
-                "aufgabe": aufgabe,
-                "loesung": loesung,
-                "erklaerung": erklaerung,
-                "punkte": 5,
-            }
-        )
 
-        # Volumenberechnung (5 Punkte)
-        aufgabe, loesung, erklaerung = self.generator.generate_geometrie(zeichnen=False)
-        self.test_content += f"**d) Volumen und Gewicht (5 Punkte)**\n{aufgabe}\n\n"
-        self.solutions += f"**d)** {loesung}\n   {erklaerung}\n\n"
-        self.detailed_solutions.append(
-            {
-                "nummer": "5.d",
-                "aufgabe": aufgabe,
-                "loesung": loesung,
-                "erklaerung": erklaerung,
-                "punkte": 5,
-            }
-        )
+# Zeilenpräfixe des Markdown-Subsets für den Word-Export
+_MD_PREFIX_RE = re.compile(r"```|### |## |- |\*\*?|\|")
 
-    def _add_bewertung(self):
-        """Fügt Bewertungsschlüssel hinzu."""
-        bewertung = """
----
 
-## Bewertungsschlüssel
+def _md_absatz(doc, puffer: list[str]) -> None:
+    """Schreibt gesammelte Textzeilen als einen Absatz mit Zeilenumbrüchen."""
+    if puffer:
+        doc.add_paragraph("\n".join(puffer))
+        puffer.clear()
 
-| Note | Bezeichnung | Punkte | Prozent |
-|------|------------|--------|---------|
-| 1 | Sehr gut | 90-100 | 90-100% |
-| 2 | Gut | 80-89 | 80-89% |
-| 3 | Befriedigend | 70-79 | 70-79% |
-| 4 | Genügend | 60-69 | 60-69% |
-| 5 | Nicht genügend | 0-59 | 0-59% |
 
-**Viel Erfolg!**
+def _md_text(doc, line: str) -> None:
+    stripped = line.strip()
+    if stripped == "---":
+        # Horizontale Linie
+        doc.add_paragraph("_" * 50)
+    elif stripped:
+        doc.add_paragraph(line)
+
+
+def _md_bold(doc, line: str) -> None:
+    if not line.endswith("**"):
+        return _md_text(doc, line)
+    doc.add_paragraph().add_run(line[2:-2]).bold = True
+
+
+def _md_italic(doc, line: str) -> None:
+    if not line.endswith("*"):
+        return _md_text(doc, line)
+    doc.add_paragraph().add_run(line[1:-1]).italic = True
+
+
+def _md_table_row(doc, line: str, table):
+    """Hängt eine Tabellenzeile an und gibt die (ggf. neue) Tabelle zurück."""
+    cols = [c.strip() for c in line.strip("|").split("|")]
+    if all(set(c) <= {"-", " "} for c in cols):
+        return table
+    if table is None:
+        table = doc.add_table(rows=1, cols=len(cols))
+        cells = table.rows[0].cells
+    else:
+        cells = table.add_row().cells
+    for j, txt in enumerate(cols):
+        cells[j].text = txt
+    return table
+
+
+_MD_HANDLERS = {
+    "## ": lambda doc, line: doc.add_heading(line[3:], 2),
+    "### ": lambda doc, line: doc.add_heading(line[4:], 3),
+    "**": _md_bold,
+    "*": _md_italic,
+    "- ": lambda doc, line: doc.add_paragraph(line[2:], style="List Bullet"),
+}
+
+
+# LaTeX-Escapes in einem Durchlauf (Sonderzeichen werden genau einmal ersetzt)
+_TEX_TRANS = str.maketrans(
+    {
+        "\\": r"\textbackslash{}",
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "{": r"\{",
+        "}": r"\}",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+    }
+)
+
+
+def _tex_escape(s: str) -> str:
+    return s.translate(_TEX_TRANS)
+
+
+# Rechenzeichen, an denen eine Zeile mit "=" als Gleichung erkannt wird
+_TEX_EQ_OPS_RE = re.compile(r"[-+·:()]")
+# Rechenzeichen der Gleichung als LaTeX-Befehle, in einem Durchlauf
+_TEX_EQ_TRANS = str.maketrans({"·": r"\cdot", ":": r"\div"})
+
+
+# Fester LaTeX-Kopf (Präambel, Kopfzeile, Titelblock) von Test und Lösungen
+_LATEX_PRAEAMBEL = r"""\documentclass[12pt,a4paper]{article}
+\usepackage[utf8]{inputenc}
+\usepackage[ngerman]{babel}
+\usepackage{amsmath}
+\usepackage{amssymb}
+\usepackage{geometry}
+\usepackage{fancyhdr}
+\usepackage{graphicx}
+\usepackage{tikz}
+
+\geometry{margin=2.5cm}
+\pagestyle{fancy}
+\fancyhf{}
+\rfoot{\thepage}
 """
-        self.test_content += bewertung
+_LATEX_BEGIN = r"""
+\begin{document}
+
+"""
+_LATEX_KOPF_TEST = (
+    _LATEX_PRAEAMBEL
+    + r"\lhead{Überstiegstest - Technische Basisausbildung}"
+    + _LATEX_BEGIN
+    + r"""\begin{center}
+\Large\textbf{Überstiegstest}\\
+\large Technische Basisausbildung\\[2em]
+\normalsize
+Name: \underline{\hspace{8cm}} \quad Datum: \underline{\hspace{4cm}}\\[1em]
+Bearbeitungszeit: 90 Minuten\\
+Gesamtpunktzahl: 100 Punkte\\
+Bestehensgrenze: 60 Punkte
+\end{center}
+
+\vspace{2em}
 
-        self.solutions += "\n## Punkteverteilung\n\n"
-        self.solutions += "- Grundrechenarten: 20 Punkte (2+2+3+3+5+5)\n"
-        self.solutions += "- Zahlenraum: 20 Punkte (5+5+3+7)\n"
-        self.solutions += "- Textaufgaben: 20 Punkte (10+10)\n"
-        self.solutions += "- Brüche/Gleichungen: 20 Punkte (12+8)\n"
-        self.solutions += "- Raumvorstellung: 20 Punkte (5+5+5+5)\n"
-        self.solutions += "\n**Gesamt: 100 Punkte**\n"
+"""
+)
+_LATEX_KOPF_LOESUNG = (
+    _LATEX_PRAEAMBEL
+    + r"\lhead{LÖSUNGEN - Überstiegstest}"
+    + _LATEX_BEGIN
+    + r"""\begin{center}
+\Large\textbf{LÖSUNGEN - Überstiegstest}\\
+\large Lösungsschlüssel für Lehrkraft
+\end{center}
+
+\vspace{2em}
+
+"""
+)
 
 
 class OutputManager:
     """Verwaltet verschiedene Ausgabeformate."""
 
+    __slots__ = ()
+
     @staticmethod
     def save_markdown(content: str, filename: str):
         """Speichert als Markdown-Datei."""
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Einmal kodieren und als Bytes schreiben, ohne TextIOWrapper-Schicht
+        with open(filename, "wb") as f:
+            f.write(content.encode("utf-8"))
         print(f"✓ Markdown gespeichert: {filename}")
 
     @staticmethod
@@ -1991,6 +2295,9 @@ class OutputManager:
             )
             return
 
+        from docx import Document
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+
         # Test-Dokument
         doc = Document()
 
@@ -2046,164 +2353,93 @@ class OutputManager:
         if not HAS_DOCX:
             return
 
-        lines = markdown_text.split("\n")
         current_table = None
         in_code_block = False
-
-        for line in lines:
-            if line.startswith("```"):
+        # Aufeinanderfolgende Text- bzw. Codezeilen werden zu einem Absatz
+        # zusammengefasst statt je Zeile einen Absatz anzulegen
+        puffer: list[str] = []
+
+        for line in markdown_text.splitlines():
+            m = _MD_PREFIX_RE.match(line)
+            prefix = m.group() if m else ""
+            if prefix == "```":
+                _md_absatz(doc, puffer)
                 in_code_block = not in_code_block
                 current_table = None
                 continue
-            if in_code_block:
-                doc.add_paragraph(line)
-                continue
-            if line.startswith("## "):
-                current_table = None
-                doc.add_heading(line[3:], 2)
-            elif line.startswith("### "):
-                current_table = None
-                doc.add_heading(line[4:], 3)
-            elif line.startswith("**") and line.endswith("**"):
-                current_table = None
-                p = doc.add_paragraph()
-                p.add_run(line[2:-2]).bold = True
-            elif (
-                line.startswith("*")
-                and line.endswith("*")
-                and not line.startswith("**")
-            ):
-                current_table = None
-                p = doc.add_paragraph()
-                p.add_run(line[1:-1]).italic = True
-            elif line.startswith("- "):
-                current_table = None
-                doc.add_paragraph(line[2:], style="List Bullet")
-            elif line.startswith("|"):
-                cols = [c.strip() for c in line.strip("|").split("|")]
-                if all(set(c) <= {"-", " "} for c in cols):
-                    continue
-                if current_table is None:
-                    current_table = doc.add_table(rows=1, cols=len(cols))
-                    hdr = current_table.rows[0].cells
-                    for j, txt in enumerate(cols):
-                        hdr[j].text = txt
-                else:
-                    row = current_table.add_row().cells
-                    for j, txt in enumerate(cols):
-                        row[j].text = txt
-            elif line.strip() == "---":
-                # Horizontale Linie
-                current_table = None
-                doc.add_paragraph("_" * 50)
-            elif line.strip():
-                current_table = None
-                doc.add_paragraph(line)
-            else:
+            if in_code_block or (not prefix and line.strip() and line.strip() != "---"):
+                puffer.append(line)
                 current_table = None
+                continue
+            _md_absatz(doc, puffer)
+            if prefix == "|":
+                current_table = _md_table_row(doc, line, current_table)
+                continue
+            current_table = None
+            _MD_HANDLERS.get(prefix, _md_text)(doc, line)
+        _md_absatz(doc, puffer)
 
     @staticmethod
     def save_latex(
-        test_content: str, solutions: str, test_name: str = "ueberstiegstest"
+        test_content: str,
+        solutions: str,
+        test_name: str = "ueberstiegstest",
+        melden: Callable[[str], None] = print,
     ):
-        """Erstellt LaTeX-Dokumente."""
+        """Erstellt LaTeX-Dokumente; Statusmeldungen gehen an ``melden``."""
         latex_test = OutputManager._markdown_to_latex(test_content, is_solution=False)
         latex_solutions = OutputManager._markdown_to_latex(solutions, is_solution=True)
 
         # Speichere LaTeX-Dateien
         with open(f"{test_name}.tex", "w", encoding="utf-8") as f:
             f.write(latex_test)
-        print(f"✓ LaTeX-Test gespeichert: {test_name}.tex")
+        melden(f"✓ LaTeX-Test gespeichert: {test_name}.tex")
 
         with open(f"{test_name}_loesungen.tex", "w", encoding="utf-8") as f:
             f.write(latex_solutions)
-        print(f"✓ LaTeX-Lösungen gespeichert: {test_name}_loesungen.tex")
+        melden(f"✓ LaTeX-Lösungen gespeichert: {test_name}_loesungen.tex")
 
         # Versuche PDF zu erstellen
         if HAS_LATEX:
+            import subprocess
+
+            # Beide Dokumente sind unabhängig und werden parallel übersetzt;
+            # nonstopmode verhindert, dass ein TeX-Fehler auf Eingabe wartet
+            procs = []
             try:
-                subprocess.run(["pdflatex", f"{test_name}.tex"], capture_output=True)
-                subprocess.run(
-                    ["pdflatex", f"{test_name}_loesungen.tex"], capture_output=True
-                )
-                print(f"✓ PDFs erstellt: {test_name}.pdf, {test_name}_loesungen.pdf")
-            except Exception:
-                print("⚠ PDF-Erstellung fehlgeschlagen")
+                for name in (test_name, f"{test_name}_loesungen"):
+                    procs.append(
+                        subprocess.Popen(
+                            ["pdflatex", "-interaction=nonstopmode", f"{name}.tex"],
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                        )
+                    )
+            except OSError:
+                # Bereits gestartete Läufe nicht verwaist zurücklassen
+                for proc in procs:
+                    proc.wait()
+                melden("⚠ PDF-Erstellung fehlgeschlagen")
+                return
+
+            # wait() liefert den Exit-Code; ungleich 0 heißt TeX-Fehler
+            if any([proc.wait() for proc in procs]):
+                melden("⚠ PDF-Erstellung fehlgeschlagen")
+            else:
+                melden(f"✓ PDFs erstellt: {test_name}.pdf, {test_name}_loesungen.pdf")
 
     @staticmethod
     def _markdown_to_latex(markdown_text: str, is_solution: bool = False) -> str:
         """Konvertiert Markdown zu LaTeX."""
-        latex = r"""\documentclass[12pt,a4paper]{article}
-\usepackage[utf8]{inputenc}
-\usepackage[ngerman]{babel}
-\usepackage{amsmath}
-\usepackage{amssymb}
-\usepackage{geometry}
-\usepackage{fancyhdr}
-\usepackage{graphicx}
-\usepackage{tikz}
-
-\geometry{margin=2.5cm}
-\pagestyle{fancy}
-\fancyhf{}
-\rfoot{\thepage}
-"""
-
-        if is_solution:
-            latex += r"\lhead{LÖSUNGEN - Überstiegstest}"
-        else:
-            latex += r"\lhead{Überstiegstest - Technische Basisausbildung}"
-
-        latex += r"""
-\begin{document}
-
-"""
-
-        if not is_solution:
-            latex += r"""\begin{center}
-\Large\textbf{Überstiegstest}\\
-\large Technische Basisausbildung\\[2em]
-\normalsize
-Name: \underline{\hspace{8cm}} \quad Datum: \underline{\hspace{4cm}}\\[1em]
-Bearbeitungszeit: 90 Minuten\\
-Gesamtpunktzahl: 100 Punkte\\
-Bestehensgrenze: 60 Punkte
-\end{center}
-
-\vspace{2em}
-
-"""
-        else:
-            latex += r"""\begin{center}
-\Large\textbf{LÖSUNGEN - Überstiegstest}\\
-\large Lösungsschlüssel für Lehrkraft
-\end{center}
-
-\vspace{2em}
-
-"""
+        out = [_LATEX_KOPF_LOESUNG if is_solution else _LATEX_KOPF_TEST]
 
         # Konvertiere Markdown zu LaTeX
-        lines = markdown_text.split("\n")
+        lines = markdown_text.splitlines()
         in_list = False
         in_table = False
         in_code = False
         expected_cols = 0
 
-        def _tex_escape(s: str) -> str:
-            return (
-                s.replace("\\", "\textbackslash{}")
-                .replace("&", r"\&")
-                .replace("%", r"\%")
-                .replace("$", r"\$")
-                .replace("#", r"\#")
-                .replace("_", r"\_")
-                .replace("{", r"\{")
-                .replace("}", r"\}")
-                .replace("~", "\textasciitilde{}")
-                .replace("^", "\textasciicircum{}")
-            )
-
         for line in lines:
             if line.strip().startswith("```"):
                 in_code = not in_code
@@ -2211,18 +2447,18 @@ Bestehensgrenze: 60 Punkte
             if in_code:
                 continue
             if line.startswith("## "):
-                latex += r"\section{" + _tex_escape(line[3:]) + "}\n"
+                out.append(r"\section{" + _tex_escape(line[3:]) + "}\n")
             elif line.startswith("### "):
-                latex += r"\subsection{" + _tex_escape(line[4:]) + "}\n"
+                out.append(r"\subsection{" + _tex_escape(line[4:]) + "}\n")
             elif line.startswith("**") and line.endswith("**"):
-                latex += f"\textbf{{{_tex_escape(line[2:-2])}}}\n\n"
+                out.append(rf"\textbf{{{_tex_escape(line[2:-2])}}}" + "\n\n")
             elif line.startswith("*") and line.endswith("*"):
-                latex += f"\textit{{{_tex_escape(line[1:-1])}}}\n\n"
+                out.append(rf"\textit{{{_tex_escape(line[1:-1])}}}" + "\n\n")
             elif line.startswith("- "):
                 if not in_list:
-                    latex += r"\begin{itemize}" + "\n"
+                    out.append(r"\begin{itemize}" + "\n")
                     in_list = True
-                latex += r"\item " + _tex_escape(line[2:]) + "\n"
+                out.append(r"\item " + _tex_escape(line[2:]) + "\n")
                 continue
             elif line.startswith("|"):
                 cols = [c.strip() for c in line.strip("|").split("|")]
@@ -2232,37 +2468,35 @@ Bestehensgrenze: 60 Punkte
                     in_table = True
                     expected_cols = len(cols)
                     colspec = " | ".join(["l"] * expected_cols)
-                    latex += r"\begin{tabular}{" + colspec + "}\n" + r"\hline" + "\n"
+                    out.append(r"\begin{tabular}{" + colspec + "}\n" + r"\hline" + "\n")
                 else:
                     if len(cols) < expected_cols:
                         cols += [""] * (expected_cols - len(cols))
                     elif len(cols) > expected_cols:
                         cols = cols[:expected_cols]
-                latex += " & ".join(_tex_escape(c) for c in cols) + " \\\n"
+                out.append(" & ".join(_tex_escape(c) for c in cols) + r" \\" + "\n")
                 continue
             else:
                 if in_list:
-                    latex += r"\end{itemize}" + "\n"
+                    out.append(r"\end{itemize}" + "\n")
                     in_list = False
                 if in_table:
-                    latex += r"\hline" + "\n" + r"\end{tabular}" + "\n\n"
+                    out.append(r"\hline" + "\n" + r"\end{tabular}" + "\n\n")
                     in_table = False
-                if "=" in line and any(
-                    op in line for op in ["+", "-", "·", ":", "(", ")"]
-                ):
-                    equation = line.replace("·", r"\cdot").replace(":", r"\div")
-                    latex += f"$${equation}$$\n"
+                if "=" in line and _TEX_EQ_OPS_RE.search(line):
+                    equation = line.translate(_TEX_EQ_TRANS)
+                    out.append(f"$${equation}$$\n")
                 elif line.strip():
-                    latex += _tex_escape(line) + "\n\n"
+                    out.append(_tex_escape(line) + "\n\n")
 
         if in_list:
-            latex += r"\end{itemize}" + "\n"
+            out.append(r"\end{itemize}" + "\n")
         if in_table:
-            latex += r"\hline" + "\n" + r"\end{tabular}" + "\n"
+            out.append(r"\hline" + "\n" + r"\end{tabular}" + "\n")
 
-        latex += r"\end{document}"
+        out.append(r"\end{document}")
 
-        return latex
+        return "".join(out)
 
 
 def main():
@@ -2277,17 +2511,12 @@ def main():
     )
 
     parser = argparse.ArgumentParser()
-    parser.add_argument("--stufe", choices=["einfach", "mittel", "schwer"])
+    parser.add_argument("--stufe", choices=list(_STUFE_MAP))
     parser.add_argument("--seed", type=int)
     args = parser.parse_args()
 
     if args.stufe:
-        map_stufe = {
-            "einfach": Schwierigkeit.EINFACH,
-            "mittel": Schwierigkeit.MITTEL,
-            "schwer": Schwierigkeit.SCHWER,
-        }
-        schwierigkeit = map_stufe[args.stufe]
+        schwierigkeit = _STUFE_MAP[args.stufe]
     else:
         if sys.stdin.isatty():
             print("Wählen Sie die Schwierigkeit:")
@@ -2332,22 +2561,40 @@ def main():
     print("Speichere Dateien...")
     print("=" * 50)
 
-    # Markdown
-    output.save_markdown(test_content, "ueberstiegstest.md")
-    output.save_markdown(solutions, "ueberstiegstest_loesungen.md")
+    # LaTeX samt pdflatex-Läufen im Hintergrund, während die übrigen Dateien
+    # geschrieben werden; die LaTeX-Meldungen werden gesammelt und erst danach
+    # ausgegeben, damit die Reihenfolge der Konsolenausgabe fest bleibt
+    latex_meldungen: list[str] = []
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        latex_job = pool.submit(
+            output.save_latex, test_content, solutions, melden=latex_meldungen.append
+        )
 
-    # Word
-    output.save_word(test_content, solutions)
+        # Markdown
+        output.save_markdown(test_content, "ueberstiegstest.md")
+        output.save_markdown(solutions, "ueberstiegstest_loesungen.md")
 
-    try:
-        output.save_latex(test_content, solutions)
-    except Exception:
-        print("⚠ LaTeX-Export übersprungen")
-
-    # Detaillierte Lösungen als JSON
-    with open("ueberstiegstest_details.json", "w", encoding="utf-8") as f:
-        json.dump(detailed, f, ensure_ascii=False, indent=2)
-    print("✓ Detaillierte Lösungen gespeichert: ueberstiegstest_details.json")
+        # Word
+        output.save_word(test_content, solutions)
+
+        # Detaillierte Lösungen als JSON
+        details = [d.to_dict() for d in detailed]
+        if HAS_ORJSON:
+            with open("ueberstiegstest_details.json", "wb") as f:
+                f.write(orjson.dumps(details, option=orjson.OPT_INDENT_2))
+        else:
+            import json
+
+            with open("ueberstiegstest_details.json", "w", encoding="utf-8") as f:
+                json.dump(details, f, ensure_ascii=False, indent=2)
+        print("✓ Detaillierte Lösungen gespeichert: ueberstiegstest_details.json")
+
+        try:
+            latex_job.result()
+        except Exception:
+            latex_meldungen.append("⚠ LaTeX-Export übersprungen")
+        for meldung in latex_meldungen:
+            print(meldung)
 
     print("\n" + "=" * 50)
     print("✅ TEST ERFOLGREICH GENERIERT!")
@@ -3,24 +3,47 @@ import platform
 import subprocess
 from pathlib import Path
 
+_SYSTEM = platform.system()
+_FILE_ATTRIBUTE_HIDDEN = 0x2
+_INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+
+def _set_hidden_windows(path: Path) -> None:
+    """Set the hidden attribute in-process instead of spawning attrib.exe."""
+    import ctypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.GetFileAttributesW.restype = ctypes.c_uint32
+    attrs = kernel32.GetFileAttributesW(str(path))
+    if attrs == _INVALID_FILE_ATTRIBUTES:
+        raise ctypes.WinError(ctypes.get_last_error())
+    if not kernel32.SetFileAttributesW(str(path), attrs | _FILE_ATTRIBUTE_HIDDEN):
+        raise ctypes.WinError(ctypes.get_last_error())
+
 
 def hide_path(path: Path) -> Path:
     """Hide the given path and restrict permissions."""
-    system = platform.system()
-    if system == "Windows":
-        subprocess.run(["attrib", "+h", str(path)], check=True)
-        subprocess.run(["icacls", str(path), "/inheritance:r"], check=True)
+    if _SYSTEM == "Windows":
+        _set_hidden_windows(path)
         subprocess.run(
-            ["icacls", str(path), "/grant:r", f"{os.getlogin()}:F"], check=True
+            [
+                "icacls",
+                str(path),
+                "/inheritance:r",
+                "/grant:r",
+                f"{os.getlogin()}:F",
+            ],
+            check=True,
         )
-    elif system == "Darwin":
+    elif _SYSTEM == "Darwin":
         subprocess.run(["chflags", "hidden", str(path)], check=True)
         path.chmod(0o700)
     else:  # Linux and other Unix
-        path.chmod(0o700)
-        if not path.name.startswith("."):
-            hidden = path.with_name("." + path.name)
-            path.rename(hidden)
+        os.chmod(path, 0o700)
+        name = path.name
+        if not name.startswith("."):
+            hidden = path.parent / ("." + name)
+            os.rename(path, hidden)
             path = hidden
     return path
 
@@ -2,6 +2,8 @@ import subprocess
 import sys
 
 FORBIDDEN = {"Ausgangsmaterial", "Ausgangsmaterial/AGENTS.py"}
+# str.startswith accepts a tuple and checks all prefixes in C
+FORBIDDEN_PREFIXES = tuple(FORBIDDEN)
 
 
 def staged_files() -> set[str]:
@@ -11,12 +13,13 @@ def staged_files() -> set[str]:
         text=True,
         check=True,
     )
-    return {line.strip() for line in result.stdout.splitlines() if line.strip()}
+    # git prints one unpadded path per line; only empty lines are dropped
+    return set(filter(None, result.stdout.splitlines()))
 
 
 def main() -> int:
     staged = staged_files()
-    conflicts = [f for f in staged if any(f.startswith(p) for p in FORBIDDEN)]
+    conflicts = [f for f in staged if f.startswith(FORBIDDEN_PREFIXES)]
     if conflicts:
         sys.stderr.write(
             "Ausgangsmaterial contains sensitive data and must not be committed.\n"
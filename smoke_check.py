@@ -14,6 +14,7 @@ Smoke-Check für Überstiegstest Generator v2.0
 import re
 import sys
 import traceback
+from itertools import islice
 
 # Importiere Deinen Generator – passe ggf. den Modulnamen an
 from Create import MathSolver, Schwierigkeit, TestGenerator, fmt
@@ -21,6 +22,16 @@ from Create import MathSolver, Schwierigkeit, TestGenerator, fmt
 OK = "✓"
 FAIL = "✗"
 
+# Einmal kompilierte Muster der Generationsprüfung
+_BAD_DEC_RE = re.compile(r"\d+\.\d+")
+_CODEBLOCK_RE = re.compile(r"```(.*?)```", re.S)
+_UNIT_RE = re.compile(
+    r"\b\d[\d\.\,]*\s?(?:m²|m³|dm³|cm²|cm³|km²|ha|l|ml|cl|dl|kg|g|mg|s|min|h)\b"
+)
+_KOMMA_DEZ_RE = re.compile(r"\d[\,]\d")
+# Erste Stellenwerttabelle: Kopfzeile "| Nr |" plus alle folgenden "|"-Zeilen
+_TABELLE_RE = re.compile(r"^[ \t]*\| Nr \|.*(?:\n[ \t]*\|.*)*", re.M)
+
 
 def assert_true(name, cond, msg=""):
     if cond:
@@ -69,6 +80,22 @@ def check_rounding_places():
     return ok
 
 
+def check_expression_evaluation():
+    print("\n[Check] Ausdrucksauswertung mit Exponent")
+    ok = True
+    # Führender Dezimalpunkt bzw. -komma muss einen Exponenten tragen dürfen
+    for expr, erwartet in [
+        (".1e3", 100.0),
+        (",1e3", 100.0),
+        ("1,5e2", 150.0),
+        (".5E+2", 50.0),
+        ("(,1e1 + 2) · 3", 9.0),
+    ]:
+        wert = MathSolver.evaluate_expression(expr)
+        ok &= assert_true(f"{expr!r} == {erwartet}", wert == erwartet, repr(wert))
+    return ok
+
+
 def check_complete_generation(seed: int, var_symbol: str = "x"):
     print(f"\n[Check] Komplette Generation (Seed={seed}, var='{var_symbol}')")
     gen = TestGenerator(Schwierigkeit.MITTEL, seed=seed, var_symbol=var_symbol)
@@ -78,49 +105,38 @@ def check_complete_generation(seed: int, var_symbol: str = "x"):
 
     # 1) Kein Punkt als Dezimaltrenner innerhalb von Zahlen (Ausnahme: Tausenderpunkt)
     # Heuristik: verbiete Muster \d+\.\d+ (Punkt zwischen Ziffern), erlaube 1.234,56 aber das matchen wir nicht
-    bad_decimal_point = re.search(r"\d+\.\d+", test_md + sol_md)
+    bad_decimal_point = _BAD_DEC_RE.search(test_md + sol_md)
     ok &= assert_true(
         "Kein '.' als Dezimaltrenner",
         bad_decimal_point is None,
         bad_decimal_point.group(0) if bad_decimal_point else "",
     )
 
-    # 2) Keine E-Notation
+    # 2) Keine E-Notation – jede Datei einzeln, ohne Verkettung
+    test_lower = test_md.lower()
+    sol_lower = sol_md.lower()
     ok &= assert_true(
         "Keine E-Notation insgesamt",
-        "e+" not in (test_md + sol_md).lower()
-        and "e-" not in (test_md + sol_md).lower(),
+        not any(
+            zeichen in test_lower or zeichen in sol_lower for zeichen in ("e+", "e-")
+        ),
     )
 
     # 3) Stellenwerttabelle: Kopf korrekt, jede Datenzeile hat 12 '|' (11 Spalten + 2 Ränder)
-    tbl_blocks = []
-    capture = False
-    for line in sol_md.splitlines():
-        if line.strip().startswith("| Nr |"):
-            capture = True
-            tbl_blocks.append([line])
-            continue
-        if capture:
-            if line.strip().startswith("|"):
-                tbl_blocks[-1].append(line)
-            else:
-                capture = False
-
-    has_table = assert_true("Stellenwerttabelle vorhanden", len(tbl_blocks) >= 1)
+    # Nur der Tabellenbereich wird in Zeilen zerlegt, nicht die ganze Lösung
+    tabelle = _TABELLE_RE.search(sol_md)
+
+    has_table = assert_true("Stellenwerttabelle vorhanden", tabelle is not None)
     ok &= has_table
     if has_table:
-        block = tbl_blocks[0]
+        block = tabelle.group(0).splitlines()
         # Kopf prüfen
         ok &= assert_true(
             "Tabellenkopf korrekt",
             "| Nr | HT | ZT | T | H | Z | E | , | z | h | t |" in block[0],
         )
         # Datenzeilen prüfen
-        data_lines = [
-            ln
-            for ln in block[1:]
-            if not set(ln.strip("|").replace("-", "").split()) <= {""}
-        ]
+        data_lines = [ln for ln in block[1:] if ln.strip("|").replace("-", "").strip()]
         expected_pipes = 12
         for dl in data_lines:
             count = dl.count("|")
@@ -147,7 +163,7 @@ def check_complete_generation(seed: int, var_symbol: str = "x"):
 
     # 5) ASCII/Codeblöcke: bleiben unverändert (strukturcheck)
     # Prüfe, dass Linienzeichen vorkommen und dreifache Backticks Blöcke einschließen
-    codeblocks = re.findall(r"```(.*?)```", test_md, flags=re.S)
+    codeblocks = _CODEBLOCK_RE.findall(test_md)
     ok &= assert_true(
         "Mindestens ein Codeblock vorhanden (ASCII/Skizzen)", len(codeblocks) >= 1
     )
@@ -158,13 +174,11 @@ def check_complete_generation(seed: int, var_symbol: str = "x"):
         )
 
     # 6) Einheiten: Stichprobenhaft auf , als Dezimaltrennzeichen prüfen
-    unit_samples = re.findall(
-        r"\b\d[\d\.\,]*\s?(?:m²|m³|dm³|cm²|cm³|km²|ha|l|ml|cl|dl|kg|g|mg|s|min|h)\b",
-        sol_md,
-    )
-    for us in unit_samples[:10]:
+    # finditer + islice: Suche endet nach der zehnten Fundstelle
+    unit_samples = [m.group(0) for m in islice(_UNIT_RE.finditer(sol_md), 10)]
+    for us in unit_samples:
         # wenn Dezimal vorhanden, dann muss ein Komma enthalten sein
-        if re.search(r"\d[\,]\d", us) or us.isdigit():
+        if _KOMMA_DEZ_RE.search(us) or us.isdigit():
             ok &= True
         else:
             # Fälle wie '10 cm' sind okay; Fälle '10.5 cm' wären falsch
@@ -180,6 +194,7 @@ def main():
     try:
         overall_ok &= check_decimal_formatting()
         overall_ok &= check_rounding_places()
+        overall_ok &= check_expression_evaluation()
         # Erzeuge mehrere Varianten; in der Praxis gern mehr Seeds
         for seed in [1, 2, 3, 4, 5]:
             overall_ok &= check_complete_generation(seed, var_symbol="x")